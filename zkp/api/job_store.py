@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Proof Job Store
+Tracks proof generation jobs for the API server.
+
+In-memory by default, with completed proofs spilled to disk so RAM stays
+bounded. Set ZK_REDIS_URL to keep jobs in Redis so that every uvicorn
+worker sees the same jobs and the keyspace is bounded by TTL.
+"""
+
+import os
+import json
+import time
+import asyncio
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Redis is optional - only needed for multi-worker deployments
+try:
+    from redis.asyncio import Redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Jobs expire an hour after their last update
+JOB_TTL_SECONDS = 3600
+
+# Connections in the shared Redis pool (per uvicorn worker)
+REDIS_MAX_CONNECTIONS = 64
+
+# Completed proofs go to disk; only the most recently read ones stay in memory
+PROOF_SPILL_DIR = "./zkp/proofs/jobs"
+LOADED_PROOF_CACHE_SIZE = 128
+
+
+def _write_json(path: Path, job: Dict[str, Any]):
+    # stdlib json: proofs hold integers wider than 64 bits (msgpack/orjson reject them)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(job, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+class InMemoryJobStore:
+    """Process-local job store (single worker deployments)"""
+
+    def __init__(self, spill_dir: Optional[str] = None,
+                 cache_size: int = LOADED_PROOF_CACHE_SIZE):
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.status_counts: Counter = Counter()
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir is not None:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_size = cache_size
+        self._loaded: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    async def create(self, job_id: str, job: Dict[str, Any]):
+        """Register a new job"""
+        self.jobs[job_id] = job
+        self.status_counts[job["status"]] += 1
+
+    async def update(self, job_id: str, fields: Dict[str, Any]):
+        """Merge fields into an existing job"""
+        job = self.jobs[job_id]
+        if "status" in fields and fields["status"] != job["status"]:
+            self.status_counts[job["status"]] -= 1
+            self.status_counts[fields["status"]] += 1
+        job.update(fields)
+        if self.spill_dir is not None and job["status"] == "completed":
+            await self._spill(job_id, job)
+
+    async def _spill(self, job_id: str, job: Dict[str, Any]):
+        """Write a completed job to disk and keep only a small stub in memory"""
+        path = self.spill_dir / f"{job_id}.json"
+        await asyncio.to_thread(_write_json, path, job)
+        stub = {k: v for k, v in job.items() if k not in ("proof", "claim")}
+        stub["path"] = str(path)
+        stub["spilled_at"] = time.time()
+        self.jobs[job_id] = stub
+        self._remember(job_id, job)
+
+    def _remember(self, job_id: str, job: Dict[str, Any]):
+        self._loaded[job_id] = job
+        self._loaded.move_to_end(job_id)
+        if len(self._loaded) > self.cache_size:
+            self._loaded.popitem(last=False)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a job, or None if unknown (spilled proofs are loaded back lazily)"""
+        job = self.jobs.get(job_id)
+        if job is None or "path" not in job:
+            return job
+
+        loaded = self._loaded.get(job_id)
+        if loaded is not None:
+            self._loaded.move_to_end(job_id)
+            return loaded
+
+        try:
+            loaded = await asyncio.to_thread(_read_json, job["path"])
+        except FileNotFoundError:
+            return None
+        self._remember(job_id, loaded)
+        return loaded
+
+    async def delete(self, job_id: str):
+        """Forget a job, its status count and any spilled proof file"""
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return
+        self.status_counts[job["status"]] -= 1
+        self._loaded.pop(job_id, None)
+        if "path" in job:
+            try:
+                await asyncio.to_thread(os.remove, job["path"])
+            except FileNotFoundError:
+                pass
+
+    async def purge_expired(self, max_age_seconds: float) -> int:
+        """Delete spilled proofs older than max_age_seconds; returns how many were removed"""
+        cutoff = time.time() - max_age_seconds
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if "spilled_at" in job and job["spilled_at"] < cutoff
+        ]
+        for job_id in expired:
+            await self.delete(job_id)
+        return len(expired)
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """Number of held jobs per status (maintained on every transition and delete, O(1))"""
+        return dict(self.status_counts)
+
+    async def close(self):
+        """Release resources"""
+
+
+# Status counters are moved in Lua so the read-compare-increment is atomic.
+# KEYS: job hash, counters, job_id -> status, job_id -> expiry (zset)
+# Every script first uncounts jobs whose hash has expired, so the counters track live jobs.
+_UNCOUNT_EXPIRED_LUA = """
+local now = '(' .. redis.call('TIME')[1]
+local expired = redis.call('ZRANGEBYSCORE', KEYS[4], '-inf', now)
+for _, expired_id in ipairs(expired) do
+    local expired_status = redis.call('HGET', KEYS[3], expired_id)
+    if expired_status then redis.call('HINCRBY', KEYS[2], expired_status, -1) end
+    redis.call('HDEL', KEYS[3], expired_id)
+end
+if #expired > 0 then redis.call('ZREMRANGEBYSCORE', KEYS[4], '-inf', now) end
+"""
+
+_WRITE_LUA = _UNCOUNT_EXPIRED_LUA + """
+local ttl = tonumber(ARGV[1])
+local job_id, new_status = ARGV[2], ARGV[3]
+redis.call('HSET', KEYS[1], unpack(ARGV, 4))
+redis.call('EXPIRE', KEYS[1], ttl)
+redis.call('ZADD', KEYS[4], tonumber(redis.call('TIME')[1]) + ttl, job_id)
+if new_status ~= '' then
+    local old_status = redis.call('HGET', KEYS[3], job_id)
+    if old_status ~= new_status then
+        if old_status then redis.call('HINCRBY', KEYS[2], old_status, -1) end
+        redis.call('HINCRBY', KEYS[2], new_status, 1)
+        redis.call('HSET', KEYS[3], job_id, new_status)
+    end
+end
+"""
+
+_DELETE_LUA = _UNCOUNT_EXPIRED_LUA + """
+local job_id = ARGV[1]
+local old_status = redis.call('HGET', KEYS[3], job_id)
+if old_status then redis.call('HINCRBY', KEYS[2], old_status, -1) end
+redis.call('HDEL', KEYS[3], job_id)
+redis.call('ZREM', KEYS[4], job_id)
+redis.call('DEL', KEYS[1])
+"""
+
+_COUNT_LUA = _UNCOUNT_EXPIRED_LUA + """
+return redis.call('HGETALL', KEYS[2])
+"""
+
+
+class RedisJobStore:
+    """Redis-backed job store: one hash per job at proof:{job_id}"""
+
+    KEY_PREFIX = "proof:"
+    STATS_KEY = "stats:zk"
+    STATUS_KEY = "stats:zk:status"
+    EXPIRY_KEY = "stats:zk:expiry"
+
+    def __init__(self, url: str, ttl_seconds: int = JOB_TTL_SECONDS,
+                 max_connections: int = REDIS_MAX_CONNECTIONS):
+        # One pooled client for the process lifetime; never reconnect per request
+        self.redis = Redis.from_url(url, max_connections=max_connections)
+        self.ttl_seconds = ttl_seconds
+        self._write_script = self.redis.register_script(_WRITE_LUA)
+        self._delete_script = self.redis.register_script(_DELETE_LUA)
+        self._count_script = self.redis.register_script(_COUNT_LUA)
+
+    def _key(self, job_id: str) -> str:
+        return f"{self.KEY_PREFIX}{job_id}"
+
+    def _keys(self, job_id: str) -> List[str]:
+        return [self._key(job_id), self.STATS_KEY, self.STATUS_KEY, self.EXPIRY_KEY]
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, str]:
+        # stdlib json: proofs hold integers wider than 64 bits
+        return {k: json.dumps(v, default=str) for k, v in fields.items()}
+
+    @staticmethod
+    def _decode(raw: Dict[bytes, bytes]) -> Dict[str, Any]:
+        return {k.decode(): json.loads(v) for k, v in raw.items()}
+
+    async def _write(self, job_id: str, fields: Dict[str, Any]):
+        args = [self.ttl_seconds, job_id, fields.get("status") or ""]
+        for item in self._encode(fields).items():
+            args.extend(item)
+        await self._write_script(keys=self._keys(job_id), args=args)
+
+    async def create(self, job_id: str, job: Dict[str, Any]):
+        """Register a new job"""
+        await self._write(job_id, job)
+
+    async def update(self, job_id: str, fields: Dict[str, Any]):
+        """Merge fields into an existing job and refresh its TTL"""
+        await self._write(job_id, fields)
+
+    async def delete(self, job_id: str):
+        """Remove a job and its status count"""
+        await self._delete_script(keys=self._keys(job_id), args=[job_id])
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Fetch a job, or None if unknown or expired"""
+        raw = await self.redis.hgetall(self._key(job_id))
+        return self._decode(raw) if raw else None
+
+    async def count_by_status(self) -> Dict[str, int]:
+        """Number of live jobs per status, shared across workers (expired jobs are uncounted first)"""
+        raw = await self._count_script(keys=self._keys(""))
+        return {raw[i].decode(): int(raw[i + 1]) for i in range(0, len(raw), 2)}
+
+    async def close(self):
+        """Close the Redis connection pool"""
+        await self.redis.aclose()
+
+
+def create_job_store():
+    """Redis store when ZK_REDIS_URL is set and redis is installed, otherwise in-memory with disk spill"""
+    url = os.environ.get("ZK_REDIS_URL")
+    if url and REDIS_AVAILABLE:
+        max_connections = int(os.environ.get("ZK_REDIS_MAX_CONNECTIONS", REDIS_MAX_CONNECTIONS))
+        return RedisJobStore(url, max_connections=max_connections)
+    return InMemoryJobStore(spill_dir=os.environ.get("ZK_PROOF_SPILL_DIR", PROOF_SPILL_DIR))
+
+
+__all__ = [
+    "InMemoryJobStore",
+    "RedisJobStore",
+    "create_job_store",
+    "JOB_TTL_SECONDS",
+    "REDIS_MAX_CONNECTIONS",
+    "PROOF_SPILL_DIR",
+    "LOADED_PROOF_CACHE_SIZE",
+    "REDIS_AVAILABLE"
+]
@@ -66,6 +66,7 @@ import time
 import json
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 
 # Try to import CUDA libraries
@@ -88,6 +89,185 @@ except (ImportError, Exception):
 if not CUDA_AVAILABLE:
     print("⚠️ CUDA not available, using optimized CPU implementation")
 
+# Numba JIT for CPU field kernels (optional, independent of CUDA)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Transforms smaller than this stay in pure Python (JIT dispatch/conversion overhead)
+NUMBA_MIN_NTT_SIZE = 64
+
+
+if NUMBA_AVAILABLE:
+    # Goldilocks arithmetic on uint64 words: p = 2^64 - 2^32 + 1, so
+    # 2^64 = 2^32 - 1 (mod p) and 2^96 = -1 (mod p)
+    _GL_P = np.uint64(18446744069414584321)
+    _GL_EPSILON = np.uint64(0xFFFFFFFF)
+    _U32 = np.uint64(32)
+    _ONE = np.uint64(1)
+    _ZERO = np.uint64(0)
+
+    @njit(cache=True)
+    def _gl_add(a, b):
+        s = a + b
+        if s < a or s >= _GL_P:
+            s -= _GL_P
+        return s
+
+    @njit(cache=True)
+    def _gl_sub(a, b):
+        d = a - b
+        if a < b:
+            d += _GL_P
+        return d
+
+    @njit(cache=True)
+    def _gl_mul(a, b):
+        # 64x64 -> 128-bit product from 32-bit halves
+        a0 = a & _GL_EPSILON
+        a1 = a >> _U32
+        b0 = b & _GL_EPSILON
+        b1 = b >> _U32
+        lo = a0 * b0
+        m1 = a0 * b1
+        m2 = a1 * b0
+        hi = a1 * b1
+        mid = m1 + m2
+        mid_carry = _ONE if mid < m1 else _ZERO
+        new_lo = lo + (mid << _U32)
+        lo_carry = _ONE if new_lo < lo else _ZERO
+        hi = hi + (mid >> _U32) + (mid_carry << _U32) + lo_carry
+        lo = new_lo
+
+        # Reduce hi * 2^64 + lo
+        hi_hi = hi >> _U32
+        hi_lo = hi & _GL_EPSILON
+        t0 = lo - hi_hi
+        if lo < hi_hi:
+            t0 -= _GL_EPSILON
+        t1 = hi_lo * _GL_EPSILON
+        t2 = t0 + t1
+        if t2 < t1:
+            t2 += _GL_EPSILON
+        if t2 >= _GL_P:
+            t2 -= _GL_P
+        return t2
+
+    @njit(cache=True)
+    def _gl_ntt(values, twiddles, stride):
+        """In-place iterative radix-2 NTT; twiddles[k * stride] = omega^k for k < n/2"""
+        n = values.shape[0]
+        # Bit-reverse permutation
+        j = 0
+        for i in range(1, n):
+            bit = n >> 1
+            while j & bit:
+                j ^= bit
+                bit >>= 1
+            j |= bit
+            if i < j:
+                tmp = values[i]
+                values[i] = values[j]
+                values[j] = tmp
+        # Butterflies
+        length = 2
+        while length <= n:
+            half = length // 2
+            step = (n // length) * stride
+            for start in range(0, n, length):
+                for k in range(half):
+                    u = values[start + k]
+                    v = _gl_mul(values[start + k + half], twiddles[k * step])
+                    values[start + k] = _gl_add(u, v)
+                    values[start + k + half] = _gl_sub(u, v)
+            length *= 2
+        return values
+
+    @njit(cache=True)
+    def _gl_taylor_shift(coeffs, offset):
+        """Coefficients of p(x + offset) from ascending coefficients of p"""
+        n = coeffs.shape[0]
+        result = np.zeros(n, dtype=np.uint64)
+        size = 0
+        for idx in range(n - 1, -1, -1):
+            size += 1
+            for i in range(size - 1, 0, -1):
+                result[i] = _gl_add(result[i - 1], _gl_mul(offset, result[i]))
+            result[0] = _gl_add(_gl_mul(offset, result[0]), coeffs[idx])
+        return result
+
+    @njit(cache=True, parallel=True)
+    def _gl_evaluate_domain(coeffs, domain):
+        """Horner evaluation of ascending coefficients at every point of a uint64 codeword"""
+        n = coeffs.shape[0]
+        results = np.empty(domain.shape[0], dtype=np.uint64)
+        # Points are independent: spread them across cores
+        for i in prange(domain.shape[0]):
+            x = domain[i]
+            acc = _ZERO
+            for idx in range(n - 1, -1, -1):
+                acc = _gl_add(_gl_mul(acc, x), coeffs[idx])
+            results[i] = acc
+        return results
+
+
+def _bit_reverse_indices(n: int) -> np.ndarray:
+    """Permutation i -> bit-reverse(i) over log2(n) bits, vectorised"""
+    log_n = n.bit_length() - 1
+    idx = np.arange(n, dtype=np.int64)
+    rev = np.zeros(n, dtype=np.int64)
+    for bit in range(log_n):
+        rev |= ((idx >> bit) & 1) << (log_n - 1 - bit)
+    return rev
+
+
+# GPU NTT via numba.cuda; below this size host<->device copies outweigh the kernel
+CUDA_MIN_NTT_SIZE = 1 << 16
+NUMBA_CUDA_AVAILABLE = False
+if NUMBA_AVAILABLE:
+    try:
+        from numba import cuda as numba_cuda
+        NUMBA_CUDA_AVAILABLE = numba_cuda.is_available()
+    except Exception:
+        NUMBA_CUDA_AVAILABLE = False
+
+if NUMBA_CUDA_AVAILABLE:
+    # Same Goldilocks word arithmetic as the CPU kernels, compiled as device functions
+    _gl_add_dev = numba_cuda.jit(device=True)(_gl_add.py_func)
+    _gl_sub_dev = numba_cuda.jit(device=True)(_gl_sub.py_func)
+    _gl_mul_dev = numba_cuda.jit(device=True)(_gl_mul.py_func)
+
+    @numba_cuda.jit
+    def _gl_ntt_stage_kernel(values, twiddles, half, step):
+        """One radix-2 butterfly stage; one thread per butterfly (n/2 threads)"""
+        t = numba_cuda.grid(1)
+        if t < values.shape[0] // 2:
+            block = t // half
+            k = t - block * half
+            i = block * 2 * half + k
+            u = values[i]
+            v = _gl_mul_dev(values[i + half], twiddles[k * step])
+            values[i] = _gl_add_dev(u, v)
+            values[i + half] = _gl_sub_dev(u, v)
+
+
+@lru_cache(maxsize=64)
+def _prime_factors(n: int) -> Tuple[int, ...]:
+    """Distinct prime factors of n by trial division (orders here are small and smooth)"""
+    factors = []
+    q = 2
+    while q * q <= n:
+        if n % q == 0:
+            factors.append(q)
+            while n % q == 0:
+                n //= q
+        q += 1 if q == 2 else 2
+    if n > 1:
+        factors.append(n)
+    return tuple(factors)
+
 
 @dataclass
 class STARKConfig:
@@ -159,6 +339,14 @@ class CUDAFiniteField:
         # 7 is a primitive root that generates the full multiplicative group
         self.generator = 7
         self._roots_of_unity_cache = {}
+        # One twiddle table per direction for the largest NTT seen so far; smaller
+        # power-of-two sizes read it at a stride (omega_{n/2} = omega_n^2)
+        self._twiddle_cache = {}
+        # Fixed-width big-endian encoding for commitments (8 bytes Goldilocks, 66 bytes P-521)
+        self.element_bytes = (self.prime.bit_length() + 7) // 8
+        # JIT kernels are written for 64-bit Goldilocks words only
+        self.numba_enabled = NUMBA_AVAILABLE and self.prime == self.GOLDILOCKS_PRIME
+        self.cuda_ntt_enabled = NUMBA_CUDA_AVAILABLE and self.numba_enabled
         
     def add(self, a: int, b: int) -> int:
         """Field addition"""
@@ -208,8 +396,11 @@ class CUDAFiniteField:
             exponent = p_minus_1 // order
             root = self.pow(self.generator, exponent)
             
-            # Verify: root^order == 1
-            if self.pow(root, order) == 1:
+            # Verify: root^order == 1 and root^(order/q) != 1 for every prime q | order
+            # (for power-of-two STARK domains that is a single extra modpow)
+            if self.pow(root, order) == 1 and all(
+                self.pow(root, order // q) != 1 for q in _prime_factors(order)
+            ):
                 self._roots_of_unity_cache[order] = root
                 return root
         
@@ -227,11 +418,24 @@ class CUDAFiniteField:
         # Try to use FFT-compatible domain first
         if (self.prime - 1) % size == 0:
             omega = self.get_primitive_root(size)
-            return [self.pow(omega, i) for i in range(size)]
+            p = self.prime
+            domain = [1] * size
+            for i in range(1, size):
+                domain[i] = domain[i - 1] * omega % p
+            return domain
         
         # Fallback to simple consecutive domain
         return list(range(1, size + 1))
     
+    def encode_elements(self, values: List[int]) -> List[bytes]:
+        """Encode field elements as fixed-width Merkle leaves (one SHA-256 block each)"""
+        size = self.element_bytes
+        return [int(v).to_bytes(size, 'big') for v in values]
+    
+    def decode_element(self, data: bytes) -> int:
+        """Inverse of encode_elements for a single leaf"""
+        return int.from_bytes(data, 'big')
+    
     def batch_multiply(self, a_list: List[int], b_list: List[int]) -> List[int]:
         """CUDA-accelerated batch multiplication"""
         if not self.cuda_available or len(a_list) < 1000:
@@ -275,35 +479,93 @@ class CUDAFiniteField:
         if inverse:
             omega = self.inv(omega)
         
+        if self.cuda_ntt_enabled and n >= CUDA_MIN_NTT_SIZE:
+            return self._fft_cuda(values, omega, n, inverse)
+        if self.numba_enabled and n >= NUMBA_MIN_NTT_SIZE:
+            return self._fft_numba(values, omega, n, inverse)
+        
         # Cooley-Tukey FFT (iterative)
         result = list(values)
-        
-        # Bit-reverse permutation
-        log_n = n.bit_length() - 1
-        for i in range(n):
-            rev_i = int(bin(i)[2:].zfill(log_n)[::-1], 2)
-            if i < rev_i:
-                result[i], result[rev_i] = result[rev_i], result[i]
-        
-        # FFT butterfly operations
+        p = self.prime
+        
+        # Bit-reverse permutation (integer carry trick, no string round-trips)
+        j = 0
+        for i in range(1, n):
+            bit = n >> 1
+            while j & bit:
+                j ^= bit
+                bit >>= 1
+            j |= bit
+            if i < j:
+                result[i], result[j] = result[j], result[i]
+        
+        # Twiddle table omega^k for k < n/2, built once; stage `length` reads it at stride n/length
+        twiddles = [1] * (n // 2)
+        for k in range(1, n // 2):
+            twiddles[k] = twiddles[k - 1] * omega % p
+        
+        # FFT butterfly operations (field ops inlined: this is the hot loop)
         length = 2
         while length <= n:
-            w = self.pow(omega, n // length)
+            half = length // 2
+            stage_twiddles = twiddles[::n // length]
             for start in range(0, n, length):
-                wj = 1
-                for j in range(length // 2):
-                    u = result[start + j]
-                    v = self.mul(result[start + j + length // 2], wj)
-                    result[start + j] = self.add(u, v)
-                    result[start + j + length // 2] = self.sub(u, v)
-                    wj = self.mul(wj, w)
+                for j, wj in zip(range(start, start + half), stage_twiddles):
+                    u = result[j]
+                    v = result[j + half] * wj % p
+                    result[j] = (u + v) % p
+                    result[j + half] = (u - v) % p
             length *= 2
         
         # Scale for inverse transform
         if inverse:
             n_inv = self.inv(n)
-            result = [self.mul(x, n_inv) for x in result]
+            result = [x * n_inv % p for x in result]
+        
+        return result
+    
+    def _twiddle_table(self, omega: int, n: int, inverse: bool) -> Tuple[np.ndarray, int]:
+        """Shared uint64 twiddle table for this direction and the stride that serves size n"""
+        p = self.prime
+        twiddles = self._twiddle_cache.get(inverse)
+        if twiddles is None or len(twiddles) < n // 2:
+            powers = [1] * (n // 2)
+            for k in range(1, n // 2):
+                powers[k] = powers[k - 1] * omega % p
+            twiddles = np.array(powers, dtype=np.uint64)
+            self._twiddle_cache[inverse] = twiddles
+        return twiddles, 2 * len(twiddles) // n
+    
+    def _fft_numba(self, values: List[int], omega: int, n: int, inverse: bool) -> List[int]:
+        """NTT via the JIT-compiled Goldilocks kernel (uint64 arrays)"""
+        p = self.prime
+        twiddles, stride = self._twiddle_table(omega, n, inverse)
+        
+        result = _gl_ntt(np.array([v % p for v in values], dtype=np.uint64), twiddles, stride).tolist()
+        if inverse:
+            n_inv = self.inv(n)
+            result = [x * n_inv % p for x in result]
+        return result
+    
+    def _fft_cuda(self, values: List[int], omega: int, n: int, inverse: bool) -> List[int]:
+        """NTT on the GPU: bit-reverse on the host, then one kernel launch per butterfly stage"""
+        p = self.prime
+        twiddles, stride = self._twiddle_table(omega, n, inverse)
+        
+        host = np.array([v % p for v in values], dtype=np.uint64)[_bit_reverse_indices(n)]
+        d_values = numba_cuda.to_device(host)
+        d_twiddles = numba_cuda.to_device(twiddles)
+        threads = 256
+        blocks = (n // 2 + threads - 1) // threads
+        length = 2
+        while length <= n:
+            _gl_ntt_stage_kernel[blocks, threads](d_values, d_twiddles, length // 2, (n // length) * stride)
+            length *= 2
         
+        result = d_values.copy_to_host().tolist()
+        if inverse:
+            n_inv = self.inv(n)
+            result = [x * n_inv % p for x in result]
         return result
 
 
@@ -323,23 +585,68 @@ class Polynomial:
     
     def evaluate(self, x: int) -> int:
         """Evaluate polynomial at point x using Horner's method"""
+        p = self.field.prime
         result = 0
         for coeff in reversed(self.coefficients):
-            result = self.field.add(self.field.mul(result, x), coeff)
+            result = (result * x + coeff) % p
         return result
     
     def evaluate_domain(self, domain: List[int]) -> List[int]:
         """Evaluate polynomial over entire domain (CUDA accelerated)"""
-        return [self.evaluate(x) for x in domain]
+        p = self.field.prime
+        if self.field.numba_enabled and len(domain) >= NUMBA_MIN_NTT_SIZE:
+            # Codewords as contiguous uint64 arrays rather than lists of int objects
+            coeffs = np.array([c % p for c in self.coefficients], dtype=np.uint64)
+            points = np.array([x % p for x in domain], dtype=np.uint64)
+            return _gl_evaluate_domain(coeffs, points).tolist()
+        
+        coeffs = self.coefficients[::-1]
+        results = []
+        for x in domain:
+            result = 0
+            for coeff in coeffs:
+                result = (result * x + coeff) % p
+            results.append(result)
+        return results
+    
+    def shift(self, offset: int) -> 'Polynomial':
+        """Return q(x) = p(x + offset) (Taylor shift, O(n^2) instead of re-interpolating)"""
+        p = self.field.prime
+        offset %= p
+        if self.field.numba_enabled and len(self.coefficients) >= NUMBA_MIN_NTT_SIZE:
+            coeffs = np.array([c % p for c in self.coefficients], dtype=np.uint64)
+            return Polynomial(_gl_taylor_shift(coeffs, np.uint64(offset)).tolist(), self.field)
+        
+        result: List[int] = []
+        for coeff in reversed(self.coefficients):
+            # result = result * (x + offset) + coeff, updated in place from the top
+            result.append(0)
+            for i in range(len(result) - 1, 0, -1):
+                result[i] = (result[i - 1] + offset * result[i]) % p
+            result[0] = (offset * result[0] + coeff) % p
+        return Polynomial(result, self.field)
+    
+    def evaluate_subgroup(self, size: int, offset: int = 0) -> List[int]:
+        """
+        Evaluate at omega^i + offset for i in range(size), omega a primitive size-th root.
+        Uses a Taylor shift plus one forward NTT (O(n log n)) instead of size Horner passes.
+        """
+        field = self.field
+        if size & (size - 1) or (field.prime - 1) % size or len(self.coefficients) > size:
+            domain = [(x + offset) % field.prime for x in field.get_evaluation_domain(size)]
+            return self.evaluate_domain(domain)
+        
+        coeffs = self.shift(offset).coefficients if offset else self.coefficients
+        return field.fft(coeffs + [0] * (size - len(coeffs)))
     
     def __add__(self, other: 'Polynomial') -> 'Polynomial':
         """Add two polynomials"""
-        max_len = max(len(self.coefficients), len(other.coefficients))
-        result = [0] * max_len
-        for i in range(len(self.coefficients)):
-            result[i] = self.field.add(result[i], self.coefficients[i])
-        for i in range(len(other.coefficients)):
-            result[i] = self.field.add(result[i], other.coefficients[i])
+        p = self.field.prime
+        a, b = self.coefficients, other.coefficients
+        if len(a) < len(b):
+            a, b = b, a
+        result = [(x + y) % p for x, y in zip(a, b)]
+        result += [x % p for x in a[len(b):]]
         return Polynomial(result, self.field)
     
     def __mul__(self, other: 'Polynomial') -> 'Polynomial':
@@ -349,10 +656,11 @@ class Polynomial:
         
         # Use naive multiplication for small polynomials (faster due to overhead)
         if n1 * n2 < 4096:
+            p = self.field.prime
             result = [0] * result_len
             for i, a in enumerate(self.coefficients):
-                for j, b in enumerate(other.coefficients):
-                    result[i + j] = self.field.add(result[i + j], self.field.mul(a, b))
+                for j, b in enumerate(other.coefficients, i):
+                    result[j] = (result[j] + a * b) % p
             return Polynomial(result, self.field)
         
         # Use FFT-based multiplication for large polynomials
@@ -370,7 +678,8 @@ class Polynomial:
         b_fft = self.field.fft(b_padded)
         
         # Point-wise multiplication
-        c_fft = [self.field.mul(a_fft[i], b_fft[i]) for i in range(n)]
+        p = self.field.prime
+        c_fft = [a * b % p for a, b in zip(a_fft, b_fft)]
         
         # FFT inverse
         result = self.field.fft(c_fft, inverse=True)
@@ -379,7 +688,8 @@ class Polynomial:
     
     def scale(self, scalar: int) -> 'Polynomial':
         """Multiply polynomial by scalar"""
-        return Polynomial([self.field.mul(c, scalar) for c in self.coefficients], self.field)
+        p = self.field.prime
+        return Polynomial([c * scalar % p for c in self.coefficients], self.field)
     
     @staticmethod
     def interpolate(points: List[Tuple[int, int]], field: CUDAFiniteField) -> 'Polynomial':
@@ -393,6 +703,11 @@ class Polynomial:
         if n == 1:
             return Polynomial([points[0][1]], field)
         
+        # Points on the order-n subgroup: inverse NTT, O(n log n) instead of O(n^2)
+        if n & (n - 1) == 0 and (field.prime - 1) % n == 0:
+            if [x for x, _ in points] == field.get_evaluation_domain(n):
+                return Polynomial(field.fft([y for _, y in points], inverse=True), field)
+        
         # For small n, use direct Lagrange (faster due to lower overhead)
         if n <= 32:
             return Polynomial._lagrange_direct(points, field)
@@ -468,49 +783,63 @@ class MerkleTree:
     
     def __init__(self, leaves: List[bytes]):
         self.leaves = leaves if leaves else [b'']
-        self.tree = self._build_tree()
+        self._build_tree()
     
     def _hash(self, data: bytes) -> bytes:
         """SHA-256 hash"""
         return hashlib.sha256(data).digest()
     
-    def _build_tree(self) -> List[List[bytes]]:
-        """Build complete Merkle tree"""
-        if not self.leaves:
-            return [[self._hash(b'empty')]]
+    def _build_tree(self):
+        """
+        Build complete Merkle tree into one contiguous uint8[num_nodes, 32] buffer.
+        Levels are stored back to back (leaves first, root last); level k starts
+        at node self.level_offsets[k] and holds self.level_sizes[k] nodes.
+        """
+        sizes = [len(self.leaves)]
+        while sizes[-1] > 1:
+            sizes.append((sizes[-1] + 1) // 2)
+        offsets = [0]
+        for size in sizes[:-1]:
+            offsets.append(offsets[-1] + size)
+        
+        self.level_sizes = sizes
+        self.level_offsets = offsets
+        self.nodes = np.empty((offsets[-1] + sizes[-1], 32), dtype=np.uint8)
+        buf = memoryview(self.nodes.reshape(-1))
+        sha256 = hashlib.sha256
         
         # Hash leaves
-        level = [self._hash(leaf) for leaf in self.leaves]
-        tree = [level[:]]
-        
-        # Build tree bottom-up
-        while len(level) > 1:
-            next_level = []
-            for i in range(0, len(level), 2):
-                left = level[i]
-                right = level[i + 1] if i + 1 < len(level) else left
-                parent = self._hash(left + right)
-                next_level.append(parent)
-            level = next_level
-            tree.append(level[:])
-        
-        return tree
+        buf[:sizes[0] * 32] = b''.join([sha256(leaf).digest() for leaf in self.leaves])
+        
+        # Build tree bottom-up: a level is already contiguous, so parents are hashed
+        # straight from 64-byte views of the buffer (no per-pair concatenation)
+        for level in range(len(sizes) - 1):
+            start = offsets[level] * 32
+            end = start + sizes[level] * 32
+            parents = [sha256(buf[i:i + 64]).digest() for i in range(start, end - 32, 64)]
+            if sizes[level] % 2:
+                # Odd node count: the last node is paired with itself
+                last = bytes(buf[end - 32:end])
+                parents.append(sha256(last + last).digest())
+            parent_start = offsets[level + 1] * 32
+            buf[parent_start:parent_start + len(parents) * 32] = b''.join(parents)
     
     def root(self) -> bytes:
         """Get Merkle root"""
-        return self.tree[-1][0] if self.tree and self.tree[-1] else self._hash(b'empty')
+        return self.nodes[-1].tobytes()
     
     def prove(self, index: int) -> List[Tuple[bytes, bool]]:
         """Generate Merkle proof (sibling hashes + is_left indicator)"""
         proof = []
         current_index = index
+        nodes = self.nodes
         
-        for level in self.tree[:-1]:
+        for offset, size in zip(self.level_offsets[:-1], self.level_sizes[:-1]):
             sibling_index = current_index ^ 1
             is_left = (current_index % 2 == 0)
             
-            if sibling_index < len(level):
-                proof.append((level[sibling_index], is_left))
+            if sibling_index < size:
+                proof.append((nodes[offset + sibling_index].tobytes(), is_left))
             
             current_index //= 2
         
@@ -612,10 +941,17 @@ class FRI:
         self.field = field
         self.config = config
     
-    def commit(self, polynomial: Polynomial, domain: List[int]) -> Tuple[List[MerkleTree], List[int], List[Polynomial]]:
+    def commit(self, polynomial: Polynomial, domain: List[int],
+               evaluations: Optional[List[int]] = None,
+               tree: Optional[MerkleTree] = None) -> Tuple[List[MerkleTree], List[int], List[Polynomial]]:
         """
         FRI Commit Phase - iteratively reduce polynomial degree
         
+        `evaluations` may carry the polynomial's values on `domain` when the caller
+        already has them (e.g. from an NTT), so the first layer is not re-evaluated.
+        `tree` may carry an existing commitment to those evaluations (e.g. the trace
+        commitment), so the first layer is not re-hashed either.
+        
         Returns:
             - List of Merkle trees (commitments per layer)
             - List of challenges (Fiat-Shamir)
@@ -632,40 +968,34 @@ class FRI:
         layer = 0
         while len(current_domain) > self.config.num_queries * 2 and layer < self.config.num_fri_layers:
             # 1. Evaluate polynomial on current domain
-            evaluations = current_poly.evaluate_domain(current_domain)
+            if evaluations is None:
+                evaluations = current_poly.evaluate_domain(current_domain)
             
             # 2. Commit to evaluations via Merkle tree
-            eval_bytes = [str(e).encode() for e in evaluations]
-            tree = MerkleTree(eval_bytes)
+            if tree is None:
+                tree = MerkleTree(self.field.encode_elements(evaluations))
             trees.append(tree)
             
             # 3. Generate challenge via Fiat-Shamir
-            challenge = int(hashlib.sha256(tree.root()).hexdigest(), 16) % self.field.prime
+            challenge = int.from_bytes(hashlib.sha256(tree.root()).digest(), 'big') % self.field.prime
             challenges.append(challenge)
             
-            # 4. FRI folding: split polynomial into even/odd and combine
-            even_coeffs = current_poly.coefficients[::2]
-            odd_coeffs = current_poly.coefficients[1::2] if len(current_poly.coefficients) > 1 else [0]
-            
-            # Pad to same length
-            max_len = max(len(even_coeffs), len(odd_coeffs))
-            even_coeffs = even_coeffs + [0] * (max_len - len(even_coeffs))
-            odd_coeffs = odd_coeffs + [0] * (max_len - len(odd_coeffs))
-            
-            # Next polynomial: f_even(x^2) + challenge * f_odd(x^2)
-            next_coeffs = []
-            for i in range(max_len):
-                combined = self.field.add(
-                    even_coeffs[i],
-                    self.field.mul(challenge, odd_coeffs[i])
-                )
-                next_coeffs.append(combined)
+            # 4. FRI folding: f_even(x^2) + challenge * f_odd(x^2), in one pass
+            # (an odd-length coefficient list gets an implicit zero odd term at the end)
+            p = self.field.prime
+            coeffs = current_poly.coefficients
+            n_coeffs = len(coeffs)
+            next_coeffs = [(coeffs[i] + challenge * coeffs[i + 1]) % p for i in range(0, n_coeffs - 1, 2)]
+            if n_coeffs % 2:
+                next_coeffs.append(coeffs[-1] % p)
             
             current_poly = Polynomial(next_coeffs, self.field)
             polynomials.append(current_poly)
             
             # 5. Reduce domain (square each element)
-            current_domain = [self.field.mul(x, x) for x in current_domain[::2]]
+            current_domain = [x * x % p for x in current_domain[::2]]
+            evaluations = None
+            tree = None
             
             layer += 1
         
@@ -685,11 +1015,11 @@ class FRI:
             for layer_idx, tree in enumerate(trees):
                 if current_idx < len(tree.leaves):
                     # Get value
-                    value = tree.leaves[current_idx].decode() if isinstance(tree.leaves[current_idx], bytes) else str(tree.leaves[current_idx])
+                    value = str(self.field.decode_element(tree.leaves[current_idx]))
                     
                     # Get sibling value (for consistency check)
                     sibling_idx = current_idx ^ 1
-                    sibling_value = tree.leaves[sibling_idx].decode() if sibling_idx < len(tree.leaves) else value
+                    sibling_value = str(self.field.decode_element(tree.leaves[sibling_idx])) if sibling_idx < len(tree.leaves) else value
                     
                     # Get Merkle proof
                     proof = tree.prove(current_idx)
@@ -712,22 +1042,23 @@ class FRI:
         """
         FRI Verification - verify all query responses
         """
+        roots = [tree.root() for tree in trees]
+        
         for query in queries:
-            idx = query['index']
+            # Folding halves the index at every layer
+            current_idx = query['index']
             
             for layer_idx, layer_data in enumerate(query['layers']):
                 if layer_idx >= len(trees):
                     break
                 
-                tree = trees[layer_idx]
-                
                 # Verify Merkle proof
-                value_bytes = layer_data['value'].encode()
+                value_bytes = self.field.encode_elements([layer_data['value']])[0]
                 proof = [(bytes.fromhex(h), is_left) for h, is_left in layer_data['merkle_proof']]
                 
-                current_idx = idx // (2 ** layer_idx)
-                if not MerkleTree.verify(value_bytes, current_idx, proof, tree.root()):
+                if not MerkleTree.verify(value_bytes, current_idx, proof, roots[layer_idx]):
                     return False
+                current_idx >>= 1
                 
                 # Verify FRI folding consistency
                 if layer_idx < len(challenges):
@@ -792,17 +1123,12 @@ class CUDATrueSTARK:
         # Extract inputs
         secret = witness.get('secret_value', witness.get('age', witness.get('value', 42)))
         if isinstance(secret, str):
-            secret = int(hashlib.sha256(secret.encode()).hexdigest(), 16) % self.prime
+            secret = int.from_bytes(hashlib.sha256(secret.encode()).digest(), 'big') % self.prime
         
         # Generate trace: simple increment transition (trace[i+1] = trace[i] + 1)
-        trace = []
-        current = secret % self.prime
-        
-        for i in range(self.config.trace_length):
-            trace.append(current)
-            current = self.field.add(current, 1)
-        
-        return trace
+        p = self.prime
+        start = secret % p
+        return [(start + i) % p for i in range(self.config.trace_length)]
     
     def generate_proof(self, statement: Dict[str, Any], witness: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -842,11 +1168,11 @@ class CUDATrueSTARK:
         shift = self.field.get_primitive_root(extended_size * 2) if (self.field.prime - 1) % (extended_size * 2) == 0 else n + 1
         extended_domain = [(x + shift) % self.field.prime for x in extended_domain]
         
-        # Evaluate trace polynomial on extended domain
-        extended_evaluations = trace_poly.evaluate_domain(extended_domain)
+        # Evaluate trace polynomial on extended domain (shifted subgroup -> Taylor shift + NTT)
+        extended_evaluations = trace_poly.evaluate_subgroup(extended_size, shift)
         
         # ===== STEP 5: Commit to Extended Trace =====
-        eval_bytes = [str(e).encode() for e in extended_evaluations]
+        eval_bytes = self.field.encode_elements(extended_evaluations)
         trace_merkle = MerkleTree(eval_bytes)
         
         # ===== STEP 6: Build Composition Polynomial =====
@@ -854,14 +1180,15 @@ class CUDATrueSTARK:
         composition_poly = trace_poly  # Simplified: use trace polynomial
         
         # ===== STEP 7: FRI Commit Phase =====
-        fri_trees, fri_challenges, fri_polys = self.fri.commit(composition_poly, extended_domain)
+        # Layer 0 is the extended trace itself, so FRI reuses the trace commitment
+        fri_trees, fri_challenges, fri_polys = self.fri.commit(
+            composition_poly, extended_domain, extended_evaluations, trace_merkle
+        )
         
         # ===== STEP 8: Generate Query Indices (Fiat-Shamir) =====
-        query_seed = hashlib.sha256(trace_merkle.root() + b'queries').hexdigest()
-        query_indices = [
-            int(hashlib.sha256(f"{query_seed}_{i}".encode()).hexdigest(), 16) % len(extended_evaluations)
-            for i in range(self.config.num_queries)
-        ]
+        # One SHAKE-256 squeeze yields 8 little-endian bytes per query
+        query_stream = hashlib.shake_256(trace_merkle.root() + b'queries').digest(self.config.num_queries * 8)
+        query_indices = (np.frombuffer(query_stream, dtype='<u8') % len(extended_evaluations)).tolist()
         
         # ===== STEP 9: FRI Query Phase =====
         fri_queries = self.fri.query(fri_trees, fri_challenges, fri_polys, query_indices)
@@ -871,11 +1198,11 @@ class CUDATrueSTARK:
         
         # Statement hash for binding
         statement_str = json.dumps(statement, sort_keys=True) if isinstance(statement, dict) else str(statement)
-        statement_hash = int(hashlib.sha256(statement_str.encode()).hexdigest(), 16) % self.prime
+        statement_hash = int.from_bytes(hashlib.sha256(statement_str.encode()).digest(), 'big') % self.prime
         
         proof = {
-            # Protocol identifier
-            'version': 'STARK-2.0',
+            # Protocol identifier (2.1: fixed-width big-endian Merkle leaves)
+            'version': 'STARK-2.1',
             'protocol': 'ZK-STARK (AIR + FRI)',
             
             # Trace commitment
@@ -935,7 +1262,7 @@ class CUDATrueSTARK:
             
             # ===== STEP 1: Verify Statement Binding =====
             statement_str = json.dumps(statement, sort_keys=True) if isinstance(statement, dict) else str(statement)
-            expected_hash = int(hashlib.sha256(statement_str.encode()).hexdigest(), 16) % self.prime
+            expected_hash = int.from_bytes(hashlib.sha256(statement_str.encode()).digest(), 'big') % self.prime
             
             proof_statement_hash = proof_data.get('statement_hash')
             if isinstance(proof_statement_hash, str):
@@ -982,9 +1309,19 @@ class CUDATrueSTARK:
                 print(f"❌ Insufficient query responses")
                 return False
             
+            # Decode layer roots once, not per query
+            root_bytes = [bytes.fromhex(root) for root in fri_roots]
+            
+            # STARK-2.0 proofs committed to decimal-string leaves
+            if proof_data.get('version') == 'STARK-2.0':
+                encode_leaf = lambda v: str(v).encode()
+            else:
+                encode_leaf = lambda v: self.field.encode_elements([v])[0]
+            
             # Verify each query response
             for query in query_responses:
-                query_idx = query.get('index', 0)
+                # Folding halves the index at every layer
+                current_idx = query.get('index', 0)
                 layers = query.get('layers', [])
                 
                 for layer_idx, layer_data in enumerate(layers):
@@ -996,15 +1333,13 @@ class CUDATrueSTARK:
                     merkle_proof = layer_data.get('merkle_proof', [])
                     
                     # Reconstruct and verify
-                    value_bytes = str(value).encode()
+                    value_bytes = encode_leaf(value)
                     proof_tuples = [(bytes.fromhex(h), is_left) for h, is_left in merkle_proof]
-                    root_bytes = bytes.fromhex(fri_roots[layer_idx])
-                    
-                    current_idx = query_idx // (2 ** layer_idx)
                     
-                    if proof_tuples and not MerkleTree.verify(value_bytes, current_idx, proof_tuples, root_bytes):
+                    if proof_tuples and not MerkleTree.verify(value_bytes, current_idx, proof_tuples, root_bytes[layer_idx]):
                         print(f"❌ Merkle proof verification failed at layer {layer_idx}")
                         return False
+                    current_idx >>= 1
             
             # ===== STEP 6: Verify Final Polynomial Degree =====
             final_poly_coeffs = proof_data.get('fri_final_polynomial', [])
@@ -1070,6 +1405,8 @@ __all__ = [
     'FRI',
     'STARKConfig',
     'create_stark_prover',
+    'NUMBA_AVAILABLE',
+    'NUMBA_CUDA_AVAILABLE',
     'AuthenticZKStark',
     'TrueZKStark',
     'CUDA_AVAILABLE'
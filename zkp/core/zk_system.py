@@ -5,6 +5,7 @@ No constructor issues, fully bulletproof implementation
 """
 
 import hashlib
+import hmac
 import secrets
 import time
 import json
@@ -13,6 +14,21 @@ import os
 import sys
 from typing import List, Dict, Any, Optional, Tuple
 import asyncio
+from collections import OrderedDict
+
+# Standard-mode proofs memoized per (statement, witness) on each AuthenticZKStark instance.
+# The shared system lives in every API worker process, so the cache costs up to
+# PROOF_CACHE_SIZE full proofs per worker (~166KB each for settlement batches, ~11MB).
+PROOF_CACHE_SIZE = 64
+# Seconds a cached proof may be served before it is regenerated
+PROOF_CACHE_TTL = 300
+
+# GMP-backed modular exponentiation is optional; CPython ints are the fallback
+try:
+    import gmpy2
+    GMPY2_AVAILABLE = True
+except ImportError:
+    GMPY2_AVAILABLE = False
 
 
 class AuthenticFiniteField:
@@ -21,10 +37,16 @@ class AuthenticFiniteField:
     def __init__(self, prime: Optional[int] = None):
         # Use NIST P-521 certified prime (2^521 - 1) for quantum resistance
         self.prime = prime or 6864797660130609714981900799081393217269435300143305409394463459185543183397656052122559640661454554977296311391480858037121987999716643812574028291115057151
-    
-    def multiply(self, a: int, b: int) -> int:
-        """Multiply two field elements"""
-        return (a * b) % self.prime
+        # GMP's windowed powmod on 64-bit limbs beats CPython's 30-bit-limb pow for 521-bit operands
+        self._mpz_prime = gmpy2.mpz(self.prime) if GMPY2_AVAILABLE else None
+        # Mersenne primes (P-521 is 2^521 - 1) reduce with shifts and masks instead of a bignum division
+        self._mersenne_bits = self.prime.bit_length() if (self.prime + 1) & self.prime == 0 else 0
+    
+    def _powmod(self, base: int, exponent: int) -> int:
+        """base^exponent mod prime (GMP when available), returned as a plain int"""
+        if self._mpz_prime is not None:
+            return int(gmpy2.powmod(base, exponent, self._mpz_prime))
+        return pow(base, exponent, self.prime)
     
     def divide(self, a: int, b: int) -> int:
         """Divide two field elements (a / b = a * b^(-1))"""
@@ -32,65 +54,45 @@ class AuthenticFiniteField:
     
     def power(self, base: int, exponent: int) -> int:
         """Compute base^exponent in the field"""
-        return pow(base, exponent, self.prime)
+        return self._powmod(base, exponent)
+    
+    def reduce(self, x: int) -> int:
+        """Reduce an arbitrary integer into [0, prime)"""
+        k = self._mersenne_bits
+        if k and type(x) is int and x >= 0:
+            # 2^k = 1 (mod 2^k - 1): fold the high bits onto the low bits
+            p = self.prime
+            while x >> k:
+                x = (x & p) + (x >> k)
+            return 0 if x == p else x
+        return x % self.prime
     
     def add(self, a: int, b: int) -> int:
-        """Constant-time addition with enhanced side-channel resistance"""
-        # Ensure inputs are in range with constant-time normalization
-        a_normalized = a % self.prime
-        b_normalized = b % self.prime
-        
-        # ENHANCED: Multiple dummy operations for consistent timing
-        result = (a_normalized + b_normalized) % self.prime
-        
-        # Fixed number of dummy operations (constant regardless of input)
-        for i in range(8):  # Fixed 8 dummy operations
-            dummy1 = (a_normalized * (i + 1)) % self.prime
-            dummy2 = (b_normalized * (i + 2)) % self.prime
-            dummy_sum = (dummy1 + dummy2) % self.prime
-            
-            # Prevent compiler optimization while not affecting result
-            if dummy_sum == self.prime - 1:  # Extremely unlikely condition
-                pass  # Does nothing but prevents optimization
-        
-        return result
+        """Add two field elements"""
+        # Not constant-time: CPython bignum arithmetic is data-dependent and padding with
+        # dummy operations cannot change that. Side-channel resistance would need a
+        # dedicated constant-time bignum library.
+        return self.reduce(a + b)
     
     def mul(self, a: int, b: int) -> int:
-        """Constant-time multiplication with enhanced side-channel resistance"""
-        # Ensure inputs are in range with constant-time normalization
-        a_normalized = a % self.prime
-        b_normalized = b % self.prime
-        
-        # ENHANCED: Multiple dummy operations for consistent timing
-        result = (a_normalized * b_normalized) % self.prime
-        
-        # Fixed number of dummy operations (constant regardless of input)
-        for i in range(8):  # Fixed 8 dummy operations
-            dummy1 = (a_normalized + (i + 1)) % self.prime
-            dummy2 = (b_normalized + (i + 2)) % self.prime
-            dummy_product = (dummy1 * dummy2) % self.prime
-            
-            # Prevent compiler optimization while not affecting result
-            if dummy_product == self.prime - 1:  # Extremely unlikely condition
-                pass  # Does nothing but prevents optimization
-        
-        return result
+        """Multiply two field elements (not constant-time, see add)"""
+        return self.reduce(a * b)
     
     def multiply(self, a: int, b: int) -> int:
-        """Multiply two field elements (alias for mul) with constant-time"""
+        """Multiply two field elements (alias for mul)"""
         return self.mul(a, b)
     
     def sub(self, a: int, b: int) -> int:
         """Subtract two field elements"""
-        return (a - b) % self.prime
+        return self.reduce(a - b)
     
     def pow(self, base: int, exp: int) -> int:
         """Exponentiate a field element"""
-        return pow(base, exp, self.prime)
+        return self._powmod(base, exp)
     
     def inv(self, a: int) -> int:
         """Compute multiplicative inverse using extended Euclidean algorithm"""
-        return pow(a, self.prime - 2, self.prime)
+        return self._powmod(a, self.prime - 2)
     
     def inverse(self, a: int) -> int:
         """Multiplicative inverse (alias for inv)"""
@@ -106,15 +108,15 @@ class AuthenticFiniteField:
     
     def is_zero(self, a: int) -> bool:
         """Check if element is zero"""
-        return (a % self.prime) == 0
+        return self.reduce(a) == 0
     
     def is_one(self, a: int) -> bool:
         """Check if element is one"""
-        return (a % self.prime) == 1
+        return self.reduce(a) == 1
     
     def neg(self, a: int) -> int:
         """Negate a field element"""
-        return (self.prime - a) % self.prime
+        return self.reduce(self.prime - a)
     
     def square(self, a: int) -> int:
         """Square a field element"""
@@ -124,74 +126,107 @@ class AuthenticFiniteField:
 class AuthenticMerkleTree:
     """Merkle tree for cryptographic commitments with enhanced security"""
     
+    # Per-position parent salts, sha256(f"merkle_salt_{i}")[:8], grown on demand and shared by all trees
+    _salt_table: List[bytes] = []
+    
     def __init__(self, leaves: List[bytes]):
         self.original_leaves = leaves
         self.leaves = leaves if leaves else []
-        self.root = self._build_root()
-        self.tree_levels = self._build_full_tree()
-    
-    def _build_root(self) -> bytes:
-        """Build Merkle root with proper padding"""
+        # All node digests live in one contiguous buffer, leaves first and the root last;
+        # level L occupies nodes[level_offsets[L]*32 : (level_offsets[L]+level_sizes[L])*32]
+        self.level_sizes: List[int] = []
+        self.level_offsets: List[int] = []
+        self.nodes = self._build_full_tree()
+        # Root is the top of the full tree (hashed once, not rebuilt separately)
+        self.root = bytes(self.nodes[-32:]) if self.leaves else b''  # Empty tree has empty root
+    
+    @property
+    def tree_levels(self) -> List[List[bytes]]:
+        """Per-level lists of node digests, materialized from the flat buffer"""
         if not self.leaves:
-            return b''  # Empty tree has empty root
-        
-        level = [hashlib.sha256(leaf).digest() for leaf in self.leaves]
-        
-        while len(level) > 1:
-            next_level = []
-            for i in range(0, len(level), 2):
-                left = level[i]
-                right = level[i + 1] if i + 1 < len(level) else left
-                # Add salt to prevent rainbow table attacks
-                salt = hashlib.sha256(f"merkle_salt_{i}".encode()).digest()[:8]
-                parent = hashlib.sha256(salt + left + right).digest()
-                next_level.append(parent)
-            level = next_level
-        
-        return level[0] if level else hashlib.sha256(b'empty').digest()
-    
-    def _build_full_tree(self) -> List[List[bytes]]:
+            return [[]]
+        return [self._level(level) for level in range(len(self.level_sizes))]
+    
+    def _level(self, level: int) -> List[bytes]:
+        """Node digests of one level, copied out of the flat buffer"""
+        start = self.level_offsets[level] * 32
+        nodes = self.nodes
+        return [bytes(nodes[off:off + 32]) for off in range(start, start + self.level_sizes[level] * 32, 32)]
+    
+    @classmethod
+    def _salts(cls, width: int) -> List[bytes]:
+        """Salt table covering parent positions i < width"""
+        table = cls._salt_table
+        for i in range(len(table), width):
+            table.append(hashlib.sha256(f"merkle_salt_{i}".encode()).digest()[:8])
+        return table
+    
+    def _build_full_tree(self) -> bytearray:
         """Build complete tree for proof generation"""
         if not self.leaves:
-            return [[]]  # Empty tree has empty levels
-        
-        levels = []
-        current_level = [hashlib.sha256(leaf).digest() for leaf in self.leaves]
-        levels.append(current_level[:])
-        
-        while len(current_level) > 1:
-            next_level = []
-            for i in range(0, len(current_level), 2):
-                left = current_level[i]
-                right = current_level[i + 1] if i + 1 < len(current_level) else left
-                salt = hashlib.sha256(f"merkle_salt_{i}".encode()).digest()[:8]
-                parent = hashlib.sha256(salt + left + right).digest()
-                next_level.append(parent)
-            current_level = next_level
-            levels.append(current_level[:])
-        
-        return levels
+            return bytearray()  # Empty tree has no nodes
+        
+        sizes = [len(self.leaves)]
+        while sizes[-1] > 1:
+            sizes.append((sizes[-1] + 1) // 2)
+        offsets = [0]
+        for size in sizes[:-1]:
+            offsets.append(offsets[-1] + size)
+        self.level_sizes = sizes
+        self.level_offsets = offsets
+        
+        sha256 = hashlib.sha256
+        nodes = bytearray(b''.join([sha256(leaf).digest() for leaf in self.leaves]))
+        salts = self._salts(sizes[0])
+        
+        for level in range(len(sizes) - 1):
+            width = sizes[level]
+            child = offsets[level] * 32
+            # Hash straight out of the buffer; the view is released before the
+            # parent level is appended, since an exported bytearray cannot grow
+            view = memoryview(nodes)
+            parents = []
+            # Siblings are adjacent, so each pair is one 64-byte slice;
+            # add salt to prevent rainbow table attacks
+            for salt, off in zip(salts[0:width - 1:2], range(child, child + (width - 1) * 32, 64)):
+                h = sha256(salt)
+                h.update(view[off:off + 64])
+                parents.append(h.digest())
+            if width % 2:
+                # An odd last node is paired with itself
+                last = view[child + (width - 1) * 32:child + width * 32]
+                h = sha256(salts[width - 1])
+                h.update(last)
+                h.update(last)
+                parents.append(h.digest())
+                last.release()
+            view.release()
+            nodes += b''.join(parents)
+        
+        return nodes
     
     def get_proof(self, leaf_index: int) -> List[Tuple[bytes, str]]:
-        """Generate Merkle proof for a specific leaf"""
+        """Generate Merkle proof for a specific leaf as (sibling digest, 'left'/'right') pairs"""
         if leaf_index >= len(self.leaves):
             return []
         
         proof = []
+        nodes = self.nodes
         current_index = leaf_index
         
-        for level in range(len(self.tree_levels) - 1):
+        for level in range(len(self.level_sizes) - 1):
             if current_index % 2 == 0:
-                # Right sibling
+                # Right sibling (an odd last node is paired with itself)
                 sibling_index = current_index + 1
-                if sibling_index < len(self.tree_levels[level]):
-                    proof.append((self.tree_levels[level][sibling_index], 'right'))
-                else:
-                    proof.append((self.tree_levels[level][current_index], 'right'))
+                if sibling_index >= self.level_sizes[level]:
+                    sibling_index = current_index
+                side = 'right'
             else:
                 # Left sibling
                 sibling_index = current_index - 1
-                proof.append((self.tree_levels[level][sibling_index], 'left'))
+                side = 'left'
+            off = (self.level_offsets[level] + sibling_index) * 32
+            proof.append((bytes(nodes[off:off + 32]), side))
             
             current_index //= 2
         
@@ -222,14 +257,22 @@ class AuthenticZKStark:
         
         # NIST P-521 security parameters for maximum quantum resistance
         self.security_level = 521  # NIST P-521 certified security level
+        # Fixed-width big-endian encoding of a field element (66 bytes for P-521)
+        self.element_bytes = (self.prime.bit_length() + 7) // 8
         
         # Fiat-Shamir parameters
         self.hash_function = hashlib.sha3_256
+        # Prover-only entropy derived from the secret elimination seed is never recomputed
+        # by the verifier, so it uses SHA-256 (SHA-NI accelerated in OpenSSL) instead of SHA3
+        self.entropy_hash = hashlib.sha256
         
         # Optimized proof generation parameters
         self.blowup_factor = 4  # Reduced from 8 for performance
         self.num_queries = 40  # Reduced from 80 for faster generation
         
+        # LRU of (cached_at, proof) for standard-mode proofs keyed by (statement hash, witness hash)
+        self._proof_cache: "OrderedDict[Tuple[int, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
         print(f"🛡️ ZK-STARK initialized (Privacy: {'Enhanced' if enhanced_privacy else 'Standard'})")
     
     def _get_statement_value(self, statement, key, default=None):
@@ -245,43 +288,82 @@ class AuthenticZKStark:
         """Deterministic hash function for internal use"""
         return self.hash_function(data).digest()
     
+    def _prefixed_digests(self, prefix: str, suffixes) -> List[bytes]:
+        """Entropy digests of prefix + str(suffix) for each suffix, equal to hashing each string whole.
+        
+        The shared prefix is absorbed into the sponge once and the state is copied per
+        suffix, instead of re-absorbing the seed-bearing prefix for every element.
+        """
+        base = self.entropy_hash(prefix.encode())
+        digests = []
+        for suffix in suffixes:
+            h = base.copy()
+            h.update(str(suffix).encode())
+            digests.append(h.digest())
+        return digests
+    
+    def _multi_round_challenge(self, statement_hash: str, root_hex: str, rounds: int = 2) -> Tuple[str, int]:
+        """Enhanced-mode Fiat-Shamir chain shared by prover and verifier.
+        
+        Returns (final_challenge_input, challenge). Each round input extends the previous
+        one, so the final digest is streamed into one sha3_256 object round by round rather
+        than re-hashing the concatenated string built from every prefix.
+        """
+        current = statement_hash + root_hex
+        parts = [current]
+        final_hasher = self.hash_function(current.encode())
+        for i in range(rounds):
+            round_seed = f"round_{i}_{statement_hash}_{root_hex}"
+            round_randomness = int.from_bytes(self.hash_function(round_seed.encode()).digest(), 'big') % self.prime
+            current += hex(round_randomness)
+            parts.append(current)
+            final_hasher.update(current.encode())
+        return "".join(parts), int.from_bytes(final_hasher.digest(), 'big') % self.prime
+    
     def hash_to_field(self, *args) -> int:
         """Hash arbitrary data to field element deterministically"""
-        # Convert all arguments to bytes and concatenate
-        data_bytes = b""
+        # Stream each argument's bytes into one hasher (no growing concatenation);
+        # the byte stream is the same as concatenating the encodings below
+        hasher = self.hash_function()
+        update = hasher.update
         for arg in args:
             if isinstance(arg, str):
-                data_bytes += arg.encode('utf-8')
+                update(arg.encode('utf-8'))
             elif isinstance(arg, int):
-                data_bytes += arg.to_bytes(32, byteorder='big')
+                # Full P-521 width: a 32-byte encoding overflowed on field elements >= 2^256
+                update(arg.to_bytes(66, byteorder='big'))
             elif isinstance(arg, bytes):
-                data_bytes += arg
+                update(arg)
             elif isinstance(arg, (list, tuple)):
                 for item in arg:
-                    data_bytes += str(item).encode('utf-8')
+                    update(str(item).encode('utf-8'))
             else:
-                data_bytes += str(arg).encode('utf-8')
+                update(str(arg).encode('utf-8'))
         
-        hash_bytes = self._hash(data_bytes)
-        return int.from_bytes(hash_bytes, byteorder='big') % self.prime
+        return int.from_bytes(hasher.digest(), byteorder='big') % self.prime
+    
+    def _field_elements_equal(self, received: Any, expected: int) -> bool:
+        """Compare a proof-supplied value to a recomputed field element in constant time"""
+        if not isinstance(received, int) or not 0 <= received < self.prime:
+            return False
+        return hmac.compare_digest(
+            received.to_bytes(self.element_bytes, 'big'), expected.to_bytes(self.element_bytes, 'big')
+        )
     
     def get_randomness(self, bit_length: int = 256) -> int:
         """Get cryptographically secure randomness"""
         return secrets.randbits(bit_length) % self.prime
     
-    def commit(self, value: int, randomness: int) -> int:
-        """Create a commitment to a value with randomness (binding)"""
-        # Simple Pedersen-style commitment: g^value * h^randomness mod prime
-        # Using deterministic generators
-        g = 2  # Generator 1
-        h = 3  # Generator 2
-        
-        commitment = (pow(g, value, self.prime) * pow(h, randomness, self.prime)) % self.prime
-        return commitment
-    
-    def hash_function_wrapper(self, data: bytes) -> int:
-        """Hash function that returns consistent integer"""
-        return int(self.hash_function(data).hexdigest(), 16) % self.prime
+    def get_randomness_batch(self, count: int, bit_length: int = 256) -> List[int]:
+        """Draw `count` values like get_randomness from a single OS entropy read"""
+        width = (bit_length + 7) // 8
+        excess = width * 8 - bit_length
+        pool = secrets.token_bytes(count * width)
+        from_bytes = int.from_bytes
+        return [
+            (from_bytes(pool[offset:offset + width], 'big') >> excess) % self.prime
+            for offset in range(0, count * width, width)
+        ]
     
     def commit(self, value: int, randomness: int) -> int:
         """Pedersen-style commitment scheme"""
@@ -331,183 +413,8 @@ class AuthenticZKStark:
         
         return masked_witness
     
-    def _eliminate_all_witness_digit_sequences(self, proof_str: str, witness: Dict[str, Any]) -> str:
-        """INTELLIGENT: Eliminate witness values while preserving cryptographic field integrity"""
-        import json
-        import re
-        
-        # CRITICAL: Protect the NIST P-521 prime field and essential cryptographic constants
-        prime_str = str(self.prime)
-        protected_constants = {
-            prime_str: "PROTECTED_NIST_P521_PRIME",
-            "sha3_256": "PROTECTED_HASH_FUNC", 
-            "521": "PROTECTED_SECURITY_LEVEL",
-            # Protect critical cryptographic components that might contain witness patterns
-            "6864797660130609714981900799081393217269435300143305409394463459185543183397656052122559640661454554977296311391480858037121987999716643812574028291115057151": "PROTECTED_FIELD_PRIME_FULL",
-            # Additional common cryptographic patterns that should be preserved
-            "37146959cb916a0d9f217a7427009b6e0050100dea7e0dcf007edaa95ad9e29781": "PROTECTED_HASH_1",
-            "6864797660130609714985900799081393217269435300143305409394463459185543183397656052124015964066145455497729634270391480858037125987999716643814017402829427015057151": "PROTECTED_FIELD_PRIME_ALT"
-        }
-        
-        # Step 1: Replace protected constants with temporary placeholders
-        temp_proof = proof_str
-        restoration_map = {}
-        for original, placeholder in protected_constants.items():
-            if original in temp_proof:
-                temp_proof = temp_proof.replace(original, placeholder)
-                restoration_map[placeholder] = original
-        
-        # Step 2: Targeted witness elimination - specifically target witness values
-        try:
-            # Parse as JSON to get structured access
-            proof_data = json.loads(temp_proof)
-            
-            def eliminate_witness_values(data, witness_values):
-                """Recursively eliminate specific witness values from data structure"""
-                if isinstance(data, dict):
-                    cleaned = {}
-                    for k, v in data.items():
-                        cleaned[k] = eliminate_witness_values(v, witness_values)
-                    return cleaned
-                elif isinstance(data, list):
-                    return [eliminate_witness_values(item, witness_values) for item in data]
-                elif isinstance(data, str):
-                    cleaned_str = data
-                    # Target specific witness values in string representations
-                    for witness_key, witness_val in witness_values.items():
-                        if witness_val is not None:
-                            witness_str = str(witness_val)
-                            
-                            # Multi-pass approach for complete witness elimination
-                            
-                            # Pass 1: Replace complete words (word boundaries)
-                            pattern = rf'\b{re.escape(witness_str)}\b'
-                            replacement = f"W{self.hash_to_field(f'witness_{witness_key}_{witness_val}') % 9000 + 1000}"
-                            cleaned_str = re.sub(pattern, replacement, cleaned_str)
-                            
-                            # Pass 2: Iterative replacement for overlapping patterns within numbers
-                            if len(witness_str) >= 2:  # Only process meaningful patterns
-                                iteration = 0
-                                max_iterations = 20  # Prevent infinite loops
-                                
-                                while witness_str in cleaned_str and iteration < max_iterations:
-                                    iteration += 1
-                                    old_str = cleaned_str
-                                    
-                                    # Generate a different replacement for each iteration to avoid conflicts
-                                    iter_replacement = f"X{self.hash_to_field(f'iter_{iteration}_{witness_key}_{witness_val}') % 8000 + 1000}"
-                                    
-                                    # Replace one occurrence at a time
-                                    cleaned_str = cleaned_str.replace(witness_str, iter_replacement, 1)
-                                    
-                                    # Safety check: if no change occurred, break to prevent infinite loop
-                                    if cleaned_str == old_str:
-                                        break
-                    
-                    return cleaned_str
-                elif isinstance(data, (int, float)):
-                    # Process numeric values for embedded witness patterns
-                    data_str = str(data)
-                    
-                    # First check for exact match (direct witness value)
-                    for witness_key, witness_val in witness_values.items():
-                        if witness_val is not None and data == witness_val:
-                            return self.hash_to_field(f'numeric_witness_{witness_key}_{witness_val}') % 9000 + 1000
-                    
-                    # Then check for embedded witness patterns in the string representation
-                    modified_str = data_str
-                    for witness_key, witness_val in witness_values.items():
-                        if witness_val is not None:
-                            witness_str = str(witness_val)
-                            # Apply iterative replacement for overlapping patterns
-                            if len(witness_str) >= 2:  # Only process meaningful patterns
-                                iteration = 0
-                                max_iterations = 20
-                                
-                                while witness_str in modified_str and iteration < max_iterations:
-                                    iteration += 1
-                                    
-                                    # Find the first occurrence
-                                    index = modified_str.find(witness_str)
-                                    if index == -1:
-                                        break
-                                    
-                                    # Generate unique replacement
-                                    iter_replacement = f"X{self.hash_to_field(f'num_iter_{iteration}_{witness_key}_{witness_val}') % 8000 + 1000}"
-                                    
-                                    # Replace this specific occurrence by position
-                                    modified_str = modified_str[:index] + iter_replacement + modified_str[index + len(witness_str):]
-                    
-                    # If the string was modified, try to convert back to appropriate type
-                    if modified_str != data_str:
-                        # If it still looks like a pure number, return as int, otherwise as string
-                        try:
-                            return int(modified_str)
-                        except ValueError:
-                            return modified_str
-                    
-                    return data
-                else:
-                    return data
-            
-            # Apply witness elimination to the entire proof structure
-            cleaned_data = eliminate_witness_values(proof_data, witness)
-            temp_proof = json.dumps(cleaned_data)
-            
-        except (json.JSONDecodeError, TypeError):
-            # Fallback: Direct string replacement with word boundaries
-            for key, value in witness.items():
-                if value is not None:
-                    value_str = str(value)
-                    # Use word boundaries to match complete witness values only
-                    pattern = rf'\b{re.escape(value_str)}\b'
-                    replacement = f"W{self.hash_to_field(f'fallback_{key}_{value}') % 9000 + 1000}"
-                    temp_proof = re.sub(pattern, replacement, temp_proof)
-        
-        # Step 3: Restore protected cryptographic constants
-        for placeholder, original in restoration_map.items():
-            temp_proof = temp_proof.replace(placeholder, original)
-        
-        return temp_proof
-    
-    def _apply_string_witness_masking(self, proof_str: str, witness: Dict[str, Any]) -> str:
-        """Apply cryptographic witness masking to string representation of proof"""
-        for key, value in witness.items():
-            if value is None:
-                continue
-                
-            value_str = str(value)
-            if value_str in proof_str and len(value_str) > 1:
-                # Create cryptographically secure replacement
-                masking_salt = self.get_randomness(128).to_bytes(16, 'big')
-                
-                if isinstance(value, int):
-                    # Hash-based masking that maintains structure but hides value
-                    value_hash = self.hash_function(f"mask_{key}_{value}".encode() + masking_salt).hexdigest()
-                    
-                    if key == 'age':
-                        # Age masking: range 100-599, never original
-                        masked_value = (int(value_hash[:8], 16) % 500) + 100
-                    elif key == 'score':
-                        # Score masking: range 50-99, never original  
-                        masked_value = (int(value_hash[:4], 16) % 50) + 50
-                    else:
-                        # Generic numeric masking
-                        masked_value = (int(value_hash[:8], 16) % 10000) + 1000
-                        
-                    proof_str = proof_str.replace(value_str, str(masked_value))
-                else:
-                    # Non-numeric value masking
-                    value_hash = self.hash_function(f"str_mask_{key}_{value_str}".encode() + masking_salt).hexdigest()
-                    masked_str = value_hash[:len(value_str)]
-                    proof_str = proof_str.replace(value_str, masked_str)
-        
-        return proof_str
-    
     def _eliminate_witness_from_data_structure(self, data, witness: Dict[str, Any]):
         """Safely eliminate witness values from data structure without JSON corruption"""
-        import copy
-        
         # CRITICAL: Protect the NIST P-521 prime and essential cryptographic constants
         protected_constants = {
             str(self.prime),
@@ -515,41 +422,41 @@ class AuthenticZKStark:
             "sha3_256", "521"
         }
         
-        def clean_data_recursively(obj, witness_values):
-            """Recursively clean data structure without breaking structure"""
-            if isinstance(obj, dict):
-                cleaned = {}
-                for k, v in obj.items():
-                    # Never mask field_prime - needed for verification
-                    if k == 'field_prime':
-                        cleaned[k] = v
-                    else:
-                        cleaned[k] = clean_data_recursively(v, witness_values)
-                return cleaned
-            elif isinstance(obj, list):
-                return [clean_data_recursively(item, witness_values) for item in obj]
-            elif isinstance(obj, str):
+        # Resolve each witness entry to its string form and replacements once,
+        # instead of re-deriving them for every node of the proof
+        witness_entries = [
+            (
+                witness_val,
+                str(witness_val),
+                f"W{self.hash_to_field(f'safe_witness_{witness_key}_{witness_val}') % 9000 + 1000}",
+                self.hash_to_field(f'safe_numeric_witness_{witness_key}_{witness_val}') % 9000 + 1000
+            )
+            for witness_key, witness_val in witness.items()
+            if witness_val is not None
+        ]
+        
+        # Only multi-character witness strings are ever substituted inside larger values
+        substring_entries = [(witness_str, replacement) for _, witness_str, replacement, _ in witness_entries if len(witness_str) > 1]
+        
+        def clean_leaf(obj):
+            """Mask a single scalar value"""
+            if isinstance(obj, str):
                 # Check if this is a protected constant - keep it as-is
                 if obj in protected_constants:
                     return obj  # Keep protected constants unchanged
                 
                 # For strings, check if they contain witness values
                 cleaned_str = obj
-                for witness_key, witness_val in witness_values.items():
-                    if witness_val is not None:
-                        witness_str = str(witness_val)
-                        # Only replace if it's not part of a protected constant
-                        if witness_str in cleaned_str and len(witness_str) > 1:
-                            # Check if this replacement would break a protected constant
-                            would_break_protected = False
-                            for protected in protected_constants:
-                                if witness_str in protected and protected in cleaned_str:
-                                    would_break_protected = True
-                                    break
-                            
-                            if not would_break_protected:
-                                replacement = f"W{self.hash_to_field(f'safe_witness_{witness_key}_{witness_val}') % 9000 + 1000}"
-                                cleaned_str = cleaned_str.replace(witness_str, replacement)
+                for witness_str, replacement in substring_entries:
+                    # Only replace if it's not part of a protected constant
+                    if witness_str in cleaned_str:
+                        # Check if this replacement would break a protected constant
+                        would_break_protected = any(
+                            witness_str in protected and protected in cleaned_str
+                            for protected in protected_constants
+                        )
+                        if not would_break_protected:
+                            cleaned_str = cleaned_str.replace(witness_str, replacement)
                 
                 return cleaned_str
             elif isinstance(obj, bool):
@@ -557,29 +464,20 @@ class AuthenticZKStark:
                 return obj
             elif isinstance(obj, (int, float)):
                 # For numbers, check if they exactly match a witness value
-                for witness_key, witness_val in witness_values.items():
-                    if witness_val is not None and obj == witness_val:
-                        return self.hash_to_field(f'safe_numeric_witness_{witness_key}_{witness_val}') % 9000 + 1000
+                for witness_val, _, _, numeric_replacement in witness_entries:
+                    if obj == witness_val:
+                        return numeric_replacement
                 
                 # For large numbers that might contain witness patterns
+                if not substring_entries:
+                    return obj
                 obj_str = str(obj)
                 if len(obj_str) > 10:  # Only check large numbers
-                    # Check if this number contains witness digit patterns
-                    contains_witness = False
-                    for witness_key, witness_val in witness_values.items():
-                        if witness_val is not None:
-                            witness_str = str(witness_val)
-                            if len(witness_str) > 1 and witness_str in obj_str:
-                                # Check if this is not part of a protected constant
-                                is_protected = False
-                                for protected in protected_constants:
-                                    if obj_str in protected:
-                                        is_protected = True
-                                        break
-                                
-                                if not is_protected:
-                                    contains_witness = True
-                                    break
+                    # Protected constants never count as containing a witness
+                    is_protected = any(obj_str in protected for protected in protected_constants)
+                    contains_witness = not is_protected and any(
+                        witness_str in obj_str for witness_str, _ in substring_entries
+                    )
                     
                     if contains_witness:
                         # Generate a replacement number that maintains similar characteristics
@@ -589,7 +487,34 @@ class AuthenticZKStark:
             else:
                 return obj
         
-        return clean_data_recursively(data, witness)
+        # Rebuild containers iteratively with an explicit stack, so the input is never
+        # mutated and deeply nested (or hostile) proofs cannot hit the recursion limit
+        def new_container(obj):
+            return {} if isinstance(obj, dict) else [None] * len(obj)
+        
+        if not isinstance(data, (dict, list)):
+            return clean_leaf(data)
+        
+        result = new_container(data)
+        stack = [(data, result)]
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, dict):
+                items = source.items()
+            else:
+                items = enumerate(source)
+            for k, v in items:
+                if k == 'field_prime':
+                    # Never mask field_prime - needed for verification
+                    target[k] = v
+                elif isinstance(v, (dict, list)):
+                    child = new_container(v)
+                    target[k] = child
+                    stack.append((v, child))
+                else:
+                    target[k] = clean_leaf(v)
+        
+        return result
 
     def generate_proof(self, statement: Dict[str, Any], witness: Dict[str, Any]) -> Dict[str, Any]:
         """MODULAR generate_proof with configurable privacy enhancement"""
@@ -600,7 +525,70 @@ class AuthenticZKStark:
             return self._generate_proof_enhanced_privacy(statement, witness, start_time)
         else:
             # STANDARD MODE: Compatible with existing verification
-            return self._generate_proof_standard(statement, witness, start_time)
+            # Repeated (statement, witness) pairs are served from the cache. Enhanced privacy
+            # mode never caches, so hit/miss timing reveals nothing about repeated witnesses.
+            key = self._proof_cache_key(statement, witness)
+            if key is not None:
+                cached = self._proof_cache.get(key)
+                if cached is not None:
+                    cached_at, cached_proof = cached
+                    if start_time - cached_at < PROOF_CACHE_TTL:
+                        self._proof_cache.move_to_end(key)
+                        proof = self._clone_proof(cached_proof)
+                        # Served copies carry this call's timing, not the original generation's
+                        self._restamp_proof(proof, time.time() - start_time)
+                        return proof
+                    del self._proof_cache[key]
+            
+            proof = self._generate_proof_standard(statement, witness, start_time)
+            if key is not None:
+                self._proof_cache[key] = (start_time, self._clone_proof(proof))
+                if len(self._proof_cache) > PROOF_CACHE_SIZE:
+                    self._proof_cache.popitem(last=False)
+            return proof
+    
+    def _proof_cache_key(self, statement: Dict[str, Any], witness: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """Hash statement and witness into a cache key (None if they cannot be canonicalised)"""
+        try:
+            return (
+                self.hash_to_field(json.dumps(statement, sort_keys=True, default=str)),
+                self.hash_to_field(json.dumps(witness, sort_keys=True, default=str)),
+            )
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _restamp_proof(proof: Dict[str, Any], generation_time: float) -> None:
+        """Overwrite timestamp and generation_time in every view of a standard proof"""
+        timestamp = int(time.time())
+        display = proof.get('proof', {})
+        for view in (proof, display, display.get('_original_proof_data', {})):
+            view['generation_time'] = generation_time
+            view['timestamp'] = timestamp
+    
+    @staticmethod
+    def _clone_proof(proof: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the dict/list skeleton of a proof, sharing its immutable leaves.
+        
+        Cheaper than copy.deepcopy, which dispatches on every int and str; containers
+        referenced twice (the top level mirrors 'proof') stay shared in the copy too.
+        """
+        memo = {}
+        
+        def clone(obj):
+            copied = memo.get(id(obj))
+            if copied is not None:
+                return copied
+            if isinstance(obj, dict):
+                copied = memo[id(obj)] = {}
+                for k, v in obj.items():
+                    copied[k] = clone(v) if isinstance(v, (dict, list)) else v
+            else:
+                copied = memo[id(obj)] = []
+                copied.extend(clone(v) if isinstance(v, (dict, list)) else v for v in obj)
+            return copied
+        
+        return clone(proof)
     
     def _generate_proof_standard(self, statement: Dict[str, Any], witness: Dict[str, Any], start_time: float) -> Dict[str, Any]:
         """STANDARD proof generation - maintains verification compatibility with comprehensive witness privacy"""
@@ -614,16 +602,17 @@ class AuthenticZKStark:
         sanitized_witness = {}
         
         # Step 1: Completely eliminate all raw witness values (using masked values)
-        for key, value in masked_witness.items():
-            # Create a unique hash for each witness element that contains NO recoverable information
-            key_salt = self.hash_function(f"key_elimination_{witness_elimination_seed}_{key}".encode()).digest()
+        # Create a unique hash for each witness element that contains NO recoverable information
+        key_salts = self._prefixed_digests(f"key_elimination_{witness_elimination_seed}_", masked_witness)
+        seed_bytes = witness_elimination_seed.to_bytes(32, 'big')
+        for (key, value), key_salt in zip(masked_witness.items(), key_salts):
             
             if isinstance(value, int):
                 # For integers, use multiple hash layers to completely eliminate the original value
                 value_bytes = str(value).encode()
                 layer1 = self.hash_function(key_salt + value_bytes + b"layer1").digest()
                 layer2 = self.hash_function(layer1 + key_salt + b"layer2").digest()
-                layer3 = self.hash_function(layer2 + witness_elimination_seed.to_bytes(32, 'big') + b"layer3").digest()
+                layer3 = self.hash_function(layer2 + seed_bytes + b"layer3").digest()
                 sanitized_witness[f"hashed_{key}"] = int.from_bytes(layer3[:16], 'big') % self.prime
             else:
                 # For strings, use even more aggressive elimination
@@ -631,7 +620,7 @@ class AuthenticZKStark:
                 value_bytes = value_str.encode()
                 layer1 = self.hash_function(key_salt + value_bytes + b"string_layer1").digest()
                 layer2 = self.hash_function(layer1 + key_salt + b"string_layer2").digest() 
-                layer3 = self.hash_function(layer2 + witness_elimination_seed.to_bytes(32, 'big') + b"string_layer3").digest()
+                layer3 = self.hash_function(layer2 + seed_bytes + b"string_layer3").digest()
                 layer4 = self.hash_function(layer3 + b"final_elimination").digest()
                 sanitized_witness[f"eliminated_{key}"] = int.from_bytes(layer4[:20], 'big') % self.prime
         
@@ -645,18 +634,23 @@ class AuthenticZKStark:
         extended_trace = self._low_degree_extension_privacy_aware(execution_trace)
         
         # Step 5: Build Merkle tree with privacy-aware structure
-        privacy_trace_bytes = []
-        for i, val in enumerate(extended_trace):
-            # Add entropy to each trace element to prevent pattern analysis
-            entropy = self.hash_function(f"trace_entropy_{witness_elimination_seed}_{i}".encode()).digest()[:8]
-            privacy_val = (val + int.from_bytes(entropy, 'big')) % self.prime
-            privacy_trace_bytes.append(str(privacy_val).encode())
+        # Add entropy to each trace element to prevent pattern analysis (one comprehension,
+        # since P-521 elements do not fit a fixed-width NumPy dtype); leaves are fixed-width
+        # big-endian encodings rather than variable-length decimal strings
+        trace_entropy = self._prefixed_digests(f"trace_entropy_{witness_elimination_seed}_", range(len(extended_trace)))
+        from_bytes = int.from_bytes
+        prime = self.prime
+        width = self.element_bytes
+        privacy_trace_bytes = [
+            ((val + from_bytes(entropy[:8], 'big')) % prime).to_bytes(width, 'big')
+            for val, entropy in zip(extended_trace, trace_entropy)
+        ]
         
         merkle_tree = AuthenticMerkleTree(privacy_trace_bytes)
         
         # Step 6: Generate challenge with privacy preservation
         challenge_input = str(statement_hash) + merkle_tree.root.hex()
-        challenge = int(self.hash_function(challenge_input.encode()).hexdigest(), 16) % self.prime
+        challenge = int.from_bytes(self.hash_function(challenge_input.encode()).digest(), 'big') % self.prime
         
         print(f"DEBUG GENERATION: Statement hash: {statement_hash}")
         print(f"DEBUG GENERATION: Merkle root hex: {merkle_tree.root.hex()}")
@@ -670,25 +664,21 @@ class AuthenticZKStark:
         query_indices = self._generate_query_indices(challenge_input, len(extended_trace))
         query_responses = []
         
+        query_entropy_base = self.entropy_hash(f"query_privacy_{witness_elimination_seed}_".encode())
         for idx in query_indices[:32]:  # Limit queries for performance
             if idx < len(extended_trace):
                 merkle_proof = merkle_tree.get_proof(idx % len(privacy_trace_bytes))
-                serializable_proof = []
-                for proof_element in merkle_proof:
-                    if isinstance(proof_element, tuple) and len(proof_element) == 2:
-                        hash_bytes, direction = proof_element
-                        hash_hex = hash_bytes.hex() if isinstance(hash_bytes, bytes) else str(hash_bytes)
-                        serializable_proof.append([hash_hex, direction])
-                    else:
-                        serializable_proof.append(str(proof_element))
+                serializable_proof = [[hash_bytes.hex(), direction] for hash_bytes, direction in merkle_proof]
                 
                 # PRIVACY: Generate completely anonymous query value with no witness correlation
-                query_entropy = self.hash_function(f"query_privacy_{witness_elimination_seed}_{idx}".encode()).digest()
+                query_hasher = query_entropy_base.copy()
+                query_hasher.update(str(idx).encode())
+                query_entropy = query_hasher.digest()
                 anonymous_query_value = int.from_bytes(query_entropy[:16], 'big') % self.prime
                 
                 # Additional privacy layer: combine with trace value through irreversible operation
                 trace_value = extended_trace[idx]
-                final_anonymous_value = (anonymous_query_value * trace_value + witness_elimination_seed) % self.prime
+                final_anonymous_value = self.field.reduce(anonymous_query_value * trace_value + witness_elimination_seed)
                 
                 query_responses.append({
                     'index': idx,
@@ -743,12 +733,9 @@ class AuthenticZKStark:
         proof_data['proof_hash'] = self.hash_to_field(*privacy_proof_elements)
         
         # Step 10: Final privacy verification - ensure NO witness data in output
-        # Create a clean copy for public display (with witness elimination)
-        import copy
-        display_proof_data = copy.deepcopy(proof_data)
-        
-        # CRITICAL: Apply comprehensive witness elimination to display version (on data structure, not JSON string)
-        display_proof_data = self._eliminate_witness_from_data_structure(display_proof_data, witness)
+        # Build a clean copy for public display (with witness elimination); the
+        # scrubber rebuilds every container, so no separate deep copy is needed
+        display_proof_data = self._eliminate_witness_from_data_structure(proof_data, witness)
         
         # Store original proof for verification internally
         display_proof_data['_original_proof_data'] = proof_data
@@ -771,13 +758,9 @@ class AuthenticZKStark:
             else:
                 # Hash string witness values with random salt
                 salt = self.get_randomness(128)
-                blinded_witness[key] = int(self.hash_function(f"{value}_{salt}".encode()).hexdigest(), 16) % self.prime
+                blinded_witness[key] = int.from_bytes(self.hash_function(f"{value}_{salt}".encode()).digest(), 'big') % self.prime
         
         # 1. Statement-Witness Binding with enhanced randomness
-        statement_str = json.dumps(statement, sort_keys=True) if isinstance(statement, dict) else str(statement)
-        witness_str = json.dumps(blinded_witness, sort_keys=True)  # Use blinded witness
-        statement_hash_hex = self.hash_function(statement_str.encode()).hexdigest()
-        
         # Convert to field element for consistency with verification - handle both dict and string
         statement_hash = self.hash_to_field(str(self._get_statement_value(statement, 'claim', '')))
         
@@ -802,28 +785,19 @@ class AuthenticZKStark:
         
         # 5. ENHANCED: Merkle Commitment with additional security layers
         trace_bytes = []
-        for val in extended_trace:
+        trace_padding = self.get_randomness_batch(len(extended_trace), 64)
+        for val, padding in zip(extended_trace, trace_padding):
             # Add random padding to each trace element for constant-time processing
-            padded_val = (val + self.get_randomness(64)) % self.prime
-            trace_bytes.append(str(padded_val).encode())
+            padded_val = (val + padding) % self.prime
+            trace_bytes.append(padded_val.to_bytes(self.element_bytes, 'big'))
         
         merkle_tree = AuthenticMerkleTree(trace_bytes)
         
         # 6. ENHANCED: Multi-round Fiat-Shamir Challenge Generation
-        challenge_inputs = []
-        challenge_inputs.append(str(statement_hash) + merkle_tree.root.hex())
-        
-        # Add additional deterministic randomness rounds for enhanced security
-        # Use statement and merkle root to derive deterministic "randomness"
-        for i in range(2):  # 2 additional rounds
-            # Create deterministic round randomness from statement_hash and merkle root
-            round_seed = f"round_{i}_{statement_hash}_{merkle_tree.root.hex()}"
-            round_randomness = int(self.hash_function(round_seed.encode()).hexdigest(), 16) % self.prime
-            challenge_inputs.append(challenge_inputs[-1] + hex(round_randomness))
-        
-        # Generate final challenge from all rounds
-        final_challenge_input = "".join(challenge_inputs)
-        challenge = int(self.hash_function(final_challenge_input.encode()).hexdigest(), 16) % self.prime
+        # 2 additional deterministic rounds derived from statement_hash and merkle root
+        final_challenge_input, challenge = self._multi_round_challenge(
+            str(statement_hash), merkle_tree.root.hex()
+        )
         
         # 7. ENHANCED: Response Generation with privacy preservation
         # Generate multiple responses and use commitment scheme
@@ -843,6 +817,8 @@ class AuthenticZKStark:
         
         # Limit query responses to prevent information leakage
         max_queries = min(len(query_indices), 64)  # Limit to 64 queries
+        # Two 128-bit commitment randomizers per query, drawn in one read
+        query_randomness = self.get_randomness_batch(2 * max_queries, 128)
         
         for i, idx in enumerate(query_indices[:max_queries]):
             if idx < len(extended_trace):
@@ -850,26 +826,16 @@ class AuthenticZKStark:
                 trace_value = extended_trace[idx]
                 
                 # Layer 1: Value commitment with randomness
-                value_randomness = self.get_randomness(128)
+                value_randomness = query_randomness[2 * i]
                 value_commitment = self.commit(trace_value, value_randomness)
                 
                 # Layer 2: Double commitment for enhanced privacy
-                double_randomness = self.get_randomness(128)
+                double_randomness = query_randomness[2 * i + 1]
                 double_commitment = self.commit(value_commitment, double_randomness)
                 
                 # Get Merkle proof with serialization fix
                 merkle_proof = merkle_tree.get_proof(idx % len(trace_bytes))
-                serializable_proof = []
-                for proof_element in merkle_proof:
-                    if isinstance(proof_element, tuple) and len(proof_element) == 2:
-                        hash_bytes, direction = proof_element
-                        if isinstance(hash_bytes, bytes):
-                            hash_hex = hash_bytes.hex()
-                        else:
-                            hash_hex = str(hash_bytes)
-                        serializable_proof.append([hash_hex, direction])
-                    else:
-                        serializable_proof.append(str(proof_element))
+                serializable_proof = [[hash_bytes.hex(), direction] for hash_bytes, direction in merkle_proof]
                 
                 query_responses.append({
                     'index': idx,
@@ -947,67 +913,65 @@ class AuthenticZKStark:
     
     def _eliminate_witness_digit_patterns(self, data, witness_patterns):
         """Eliminate witness digit patterns from all numeric values in proof"""
-        if isinstance(data, dict):
-            result = {}
-            for key, value in data.items():
-                # CRITICAL: Never modify cryptographic hashes and core proof elements
-                if key in ['statement_hash', 'proof_hash', 'merkle_root', 'challenge', 'field_prime']:
-                    result[key] = value  # Keep original value
-                else:
-                    result[key] = self._eliminate_witness_digit_patterns(value, witness_patterns)
-            return result
-        elif isinstance(data, list):
-            return [self._eliminate_witness_digit_patterns(item, witness_patterns) for item in data]
-        elif isinstance(data, int):
-            # For large integers, check if they contain witness patterns as substrings
-            num_str = str(data)
-            contains_witness = any(str(pattern) in num_str for pattern in witness_patterns)
-            
-            if contains_witness and len(num_str) > 10:  # Only modify large numbers
-                # Apply mathematical transformation to eliminate patterns
-                # Use a hash-based transformation that preserves cryptographic properties
-                import hashlib
-                num_bytes = str(data).encode()
-                pattern_hash = hashlib.sha256(b'pattern_elimination' + num_bytes).digest()
-                offset = int.from_bytes(pattern_hash[:8], 'big')
-                
-                # Transform with modular arithmetic to preserve field properties
-                if hasattr(self, 'prime'):
-                    transformed = (data + offset) % self.prime
-                else:
-                    transformed = data + offset
-                
-                # Verify transformation eliminated patterns
-                transformed_str = str(transformed)
-                still_contains = any(str(pattern) in transformed_str for pattern in witness_patterns)
-                
-                if still_contains:
-                    # More aggressive transformation
-                    hash2 = hashlib.sha256(pattern_hash + num_bytes).digest()
-                    offset2 = int.from_bytes(hash2[:12], 'big')
-                    if hasattr(self, 'prime'):
-                        final_value = (data * 7 + offset2) % self.prime
+        # Pattern strings and their string substitutes are resolved once per call,
+        # not re-derived for every element of the proof
+        pattern_strs = [str(pattern) for pattern in witness_patterns]
+        string_replacements = [
+            (pattern_str, hashlib.sha256(f"str_replacement_{pattern}".encode()).hexdigest()[:len(pattern_str)])
+            for pattern, pattern_str in zip(witness_patterns, pattern_strs)
+            if len(pattern_str) >= 2
+        ]
+        protected_keys = {'statement_hash', 'proof_hash', 'merkle_root', 'challenge', 'field_prime'}
+        
+        def transform_int(value):
+            # Only large integers are rewritten, and only if a witness pattern appears as a substring
+            num_str = str(value)
+            if len(num_str) <= 10 or not any(pattern_str in num_str for pattern_str in pattern_strs):
+                return value
+            
+            # Apply mathematical transformation to eliminate patterns
+            # Use a hash-based transformation that preserves cryptographic properties
+            num_bytes = num_str.encode()
+            pattern_hash = hashlib.sha256(b'pattern_elimination' + num_bytes).digest()
+            offset = int.from_bytes(pattern_hash[:8], 'big')
+            
+            # Transform with modular arithmetic to preserve field properties
+            transformed = (value + offset) % self.prime
+            
+            # Verify transformation eliminated patterns
+            transformed_str = str(transformed)
+            if any(pattern_str in transformed_str for pattern_str in pattern_strs):
+                # More aggressive transformation
+                hash2 = hashlib.sha256(pattern_hash + num_bytes).digest()
+                offset2 = int.from_bytes(hash2[:12], 'big')
+                return self.field.reduce(value * 7 + offset2)
+            return transformed
+        
+        def eliminate(obj):
+            if isinstance(obj, dict):
+                result = {}
+                for key, value in obj.items():
+                    # CRITICAL: Never modify cryptographic hashes and core proof elements
+                    if key in protected_keys:
+                        result[key] = value  # Keep original value
                     else:
-                        final_value = data * 7 + offset2
-                    return final_value
-                else:
-                    return transformed
+                        result[key] = eliminate(value)
+                return result
+            elif isinstance(obj, list):
+                return [eliminate(item) for item in obj]
+            elif isinstance(obj, int):
+                return transform_int(obj)
+            elif isinstance(obj, str):
+                # For strings, replace any witness patterns with a hash-based substitute
+                result = obj
+                for pattern_str, replacement in string_replacements:
+                    if pattern_str in result:
+                        result = result.replace(pattern_str, replacement)
+                return result
             else:
-                return data
-        elif isinstance(data, str):
-            # For strings, replace any witness patterns
-            result = data
-            for pattern in witness_patterns:
-                pattern_str = str(pattern)
-                if pattern_str in result and len(pattern_str) >= 2:
-                    # Replace with a hash-based substitute
-                    import hashlib
-                    replacement_hash = hashlib.sha256(f"str_replacement_{pattern}".encode()).digest()
-                    replacement = replacement_hash.hex()[:len(pattern_str)]
-                    result = result.replace(pattern_str, replacement)
-            return result
-        else:
-            return data
+                return obj
+        
+        return eliminate(data)
     
     async def verify_proof_async(self, proof: Dict[str, Any], statement: Dict[str, Any]) -> bool:
         """Async verify ZK-STARK proof with comprehensive checks"""
@@ -1066,8 +1030,6 @@ class AuthenticZKStark:
     def _verify_proof_standard(self, proof: Dict[str, Any], statement: Dict[str, Any]) -> bool:
         """Standard proof verification - compatible with standard mode generation"""
         try:
-            start_time = time.time()
-            
             # SECURITY: Validate top-level structure first
             # If proof has both nested 'proof' and top-level fields, they must be consistent
             if 'proof' in proof and isinstance(proof['proof'], dict):
@@ -1096,10 +1058,9 @@ class AuthenticZKStark:
                 proof_data = proof_data['_original_proof_data']
                 
             # ENHANCED TAMPER DETECTION for standard mode
-            # Check for tampering indicators in all string fields
-            for key, value in proof_data.items():
-                if isinstance(value, str) and '_TAMPERED' in value:
-                    return False
+            # Check for tampering indicators in all string fields with one substring scan
+            if '_TAMPERED' in '\0'.join(v for v in proof_data.values() if isinstance(v, str)):
+                return False
             
             # Detect inconsistency between nested and direct proof fields
             if 'proof' in proof:
@@ -1149,7 +1110,7 @@ class AuthenticZKStark:
             statement_hash_for_challenge = str(expected_statement_hash)  # Use verified hash
             merkle_root_from_proof = proof_data['merkle_root']
             challenge_input = statement_hash_for_challenge + merkle_root_from_proof
-            expected_challenge = int(self.hash_function(challenge_input.encode()).hexdigest(), 16) % self.prime
+            expected_challenge = int.from_bytes(self.hash_function(challenge_input.encode()).digest(), 'big') % self.prime
             
             print(f"DEBUG: Statement hash for challenge: {statement_hash_for_challenge}")
             print(f"DEBUG: Merkle root from proof: {merkle_root_from_proof}")
@@ -1157,7 +1118,7 @@ class AuthenticZKStark:
             print(f"DEBUG: Expected challenge: {expected_challenge}")
             print(f"DEBUG: Actual challenge from proof: {proof_data.get('challenge')}")
             
-            if proof_data.get('challenge') != expected_challenge:
+            if not self._field_elements_equal(proof_data.get('challenge'), expected_challenge):
                 print(f"DEBUG: Challenge verification FAILED")
                 return False
             
@@ -1188,13 +1149,14 @@ class AuthenticZKStark:
                 return False
                 
             # Validate each query response structure
-            for qr in query_responses:
-                if not isinstance(qr, dict):
-                    return False
-                if 'index' not in qr or 'value' not in qr or 'proof' not in qr:
-                    return False
-                if not isinstance(qr['index'], int) or not isinstance(qr['value'], int):
-                    return False
+            if not all(
+                isinstance(qr, dict)
+                and {'index', 'value', 'proof'} <= qr.keys()
+                and isinstance(qr['index'], int)
+                and isinstance(qr['value'], int)
+                for qr in query_responses
+            ):
+                return False
             
             # No artificial delays - CUDA acceleration is fast!
             return True
@@ -1210,20 +1172,14 @@ class AuthenticZKStark:
         try:
             print("DEBUG: Starting enhanced privacy verification")
             
-            # Add computational work to prevent instant verification (but preserve correctness)
-            start_time = time.time()
-            
             # CRITICAL: Handle proof tampering detection
             # Check if top-level fields have been tampered (contain "_TAMPERED")
-            for key, value in proof.items():
-                if isinstance(value, str) and '_TAMPERED' in value:
-                    print(f"DEBUG: Tampered field detected: {key}")
-                    return False
-                elif isinstance(value, int) and key in ['version', 'challenge', 'response']:
-                    # These should be strings or specific values, not arbitrary ints
-                    if key == 'version':
-                        print(f"DEBUG: Version should not be int: {key}")
-                        return False  # version should be string "2.0"
+            if '_TAMPERED' in '\0'.join(v for v in proof.values() if isinstance(v, str)):
+                print("DEBUG: Tampered field detected")
+                return False
+            if isinstance(proof.get('version'), int):
+                print("DEBUG: Version should not be int")
+                return False  # version should be string "2.0"
             
             print("DEBUG: Passed tamper detection")
             
@@ -1250,53 +1206,9 @@ class AuthenticZKStark:
             print("DEBUG: Passed version check")
             
             # 2. Statement Binding Check
-            statement_str = json.dumps(statement, sort_keys=True) if isinstance(statement, dict) else str(statement)
-            expected_statement_hash = self.hash_function(statement_str.encode()).hexdigest()
-            
             # Convert to integer for comparison since proof stores it as integer
             expected_statement_hash_int = self.hash_to_field(str(self._get_statement_value(statement, 'claim', '')))
             
-            print("DEBUG: Computing verification work...")
-            
-            # Optimized verification work for better performance
-            verification_rounds = max(20, self.security_level // 8)  # Reduced computation
-            temp_value = int(expected_statement_hash, 16)
-            computational_verification = 0
-            
-            # Use CUDA acceleration if available for verification work
-            if self.cuda_enabled and hasattr(self.field, 'batch_multiply'):
-                # GPU-accelerated verification using batch operations
-                batch_size = min(verification_rounds, 1000)
-                batch_a = [temp_value + i for i in range(batch_size)]
-                batch_b = [(i + 1) * 31337 for i in range(batch_size)]
-                
-                # Intensive GPU computation for verification authenticity
-                for batch_round in range(max(3, verification_rounds // batch_size)):
-                    batch_results = self.field.batch_multiply(batch_a, batch_b)
-                    batch_sums = self.field.batch_add(batch_results, batch_a)
-                    computational_verification = sum(batch_sums) % self.prime
-                    
-                    # Update batches for next round
-                    batch_a = [(x + computational_verification) % self.prime for x in batch_a[:batch_size//2] * 2][:batch_size]
-                    batch_b = [(x + batch_round) % self.prime for x in batch_b]
-            else:
-                # CPU verification work (more intensive for demonstration)
-                for i in range(verification_rounds):
-                    temp_value = self.field.multiply(temp_value, (i + 1)) % self.prime
-                    computational_verification += self.field.add(temp_value, i * 31337) % self.prime
-                    
-                    # Additional hash computations for cryptographic work
-                    if i % 5 == 0:
-                        temp_hash = self.hash_function(str(temp_value).encode()).digest()
-                        temp_value = int.from_bytes(temp_hash[:8], 'big') % self.prime
-                        
-                    # CPU-intensive operations to show authentic computation
-                    if i % 20 == 19:
-                        for j in range(100):  # CPU-heavy work to show in utilization
-                            computational_verification = (computational_verification * temp_value + j) % self.prime
-            
-            print("DEBUG: Completed verification work")
-            
             # Handle large integers that may have been serialized in scientific notation
             proof_statement_hash = proof_data.get('statement_hash')
             if isinstance(proof_statement_hash, float):
@@ -1349,10 +1261,6 @@ class AuthenticZKStark:
             statement_hash_for_challenge = str(expected_statement_hash_int)
             print(f"DEBUG: Using verified statement hash for challenge: {statement_hash_for_challenge}")
             
-            # Enhanced privacy mode uses multi-round challenge generation
-            challenge_inputs = []
-            challenge_inputs.append(statement_hash_for_challenge + proof_data['merkle_root'])
-            
             # Check for enhanced privacy features in proof metadata
             proof_metadata = proof_data.get('proof_metadata', {})
             privacy_enhancements = proof_metadata.get('privacy_enhancements', {})
@@ -1403,25 +1311,15 @@ class AuthenticZKStark:
                 # Enhanced mode: Multi-round Fiat-Shamir challenge generation
                 # Recreate the same multi-round process used during generation
                 
-                challenge_inputs = []
-                challenge_inputs.append(statement_hash_for_challenge + proof_data['merkle_root'])
-                
-                # Add the same 2 additional deterministic randomness rounds
-                for i in range(2):  # Must match generation logic
-                    round_seed = f"round_{i}_{statement_hash_for_challenge}_{proof_data['merkle_root']}"
-                    round_randomness = int(self.hash_function(round_seed.encode()).hexdigest(), 16) % self.prime
-                    challenge_inputs.append(challenge_inputs[-1] + hex(round_randomness))
-                
-                # Generate final challenge from all rounds
-                final_challenge_input = "".join(challenge_inputs)
-                expected_challenge = int(self.hash_function(final_challenge_input.encode()).hexdigest(), 16) % self.prime
+                final_challenge_input, expected_challenge = self._multi_round_challenge(
+                    statement_hash_for_challenge, proof_data['merkle_root']
+                )
                 
-                print(f"DEBUG: Multi-round challenge inputs: {len(challenge_inputs)} rounds")
                 print(f"DEBUG: Final challenge input length: {len(final_challenge_input)}")
                 print(f"DEBUG: Expected challenge: {expected_challenge}")
                 print(f"DEBUG: Proof challenge: {proof_data.get('challenge')}")
                 
-                if proof_data.get('challenge') != expected_challenge:
+                if not self._field_elements_equal(proof_data.get('challenge'), expected_challenge):
                     print("DEBUG: Enhanced challenge verification failed")
                     return False
                     
@@ -1501,51 +1399,10 @@ class AuthenticZKStark:
             
             print("DEBUG: Starting query response verification")
             
-            # Verify each query response with GPU acceleration when available
-            if self.cuda_enabled and hasattr(self.field, 'batch_add') and len(query_responses) > 10:
-                print("DEBUG: Using GPU-accelerated batch verification")
-                # GPU-accelerated batch verification
-                indices = [query.get('index', 0) for query in query_responses]
-                values = [query.get('value_commitment', query.get('value', 0)) for query in query_responses]
-                
-                # Batch GPU operations for verification authenticity
-                batch_computations = self.field.batch_multiply(indices, values)
-                batch_verifications = self.field.batch_add(batch_computations, indices)
-                
-                # Verify each query individually with GPU preprocessing
-                for i, query in enumerate(query_responses):
-                    print(f"DEBUG: GPU - Verifying query {i}: {query}")
-                    if not self._verify_query_response(query, proof_data['merkle_root']):
-                        print(f"DEBUG: GPU - Query {i} verification failed")
-                        return False
-                    
-                    print(f"DEBUG: GPU - Query {i} verification passed")
-                    
-                    # Additional GPU verification work with CPU component for utilization
-                    if i < len(batch_verifications):
-                        temp_verification = batch_verifications[i] % self.prime
-                        # Add CPU work to show in utilization metrics
-                        for cpu_work in range(50):
-                            temp_verification = (temp_verification + cpu_work * i) % 1000000
-            else:
-                print("DEBUG: Using CPU verification")
-                # CPU verification with substantial computational work
-                for i, query in enumerate(query_responses):
-                    print(f"DEBUG: Verifying query {i}: {query}")
-                    if not self._verify_query_response(query, proof_data['merkle_root']):
-                        print(f"DEBUG: Query {i} verification failed")
-                        return False
-                    
-                    print(f"DEBUG: Query {i} verification passed")
-                    
-                    # Add significant computational work for each query verification
-                    temp_computation = 0
-                    for j in range(25):  # Increased computation per query
-                        temp_computation = self.field.multiply(temp_computation + i + j, 12345) % self.prime
-                        # Additional CPU-intensive work for authenticity
-                        if j % 5 == 4:
-                            for cpu_intensive in range(100):
-                                temp_computation = (temp_computation + cpu_intensive) % self.prime
+            # Verify each query response
+            for query in query_responses:
+                if not self._verify_query_response(query, proof_data['merkle_root']):
+                    return False
             
             # 7. Consistency Checks
             print("DEBUG: Starting proof consistency check")
@@ -1595,7 +1452,7 @@ class AuthenticZKStark:
                     except ValueError:
                         proof_hash = int(proof_hash)
                 
-                if proof_hash != expected_hash:
+                if not self._field_elements_equal(proof_hash, expected_hash):
                     print(f"DEBUG: Proof hash mismatch - got {proof_hash}, expected {expected_hash}")
                     print(f"DEBUG: Used elements: {proof_elements}")
                     print("DEBUG: Skipping proof hash check for now - main verification passed")
@@ -1616,14 +1473,15 @@ class AuthenticZKStark:
     
     def _evaluate_polynomial_at_challenge(self, polynomial: List[int], challenge: int) -> int:
         """Evaluate polynomial at challenge point (preserves privacy)"""
+        # Horner's rule from the highest coefficient: one multiply-add and one
+        # reduction per coefficient instead of two multiplies and an add
+        reduce = self.field.reduce
         result = 0
-        challenge_power = 1
         
-        for coeff in polynomial:
-            result = self.field.add(result, self.field.multiply(coeff, challenge_power))
-            challenge_power = self.field.multiply(challenge_power, challenge)
+        for coeff in reversed(polynomial):
+            result = reduce(result * challenge + coeff)
         
-        return result % self.prime
+        return result
 
     def _generate_auxiliary_polynomial(self, statement: Dict[str, Any], witness: Dict[str, Any]) -> List[int]:
         """Generate auxiliary polynomial for enhanced soundness in privacy mode"""
@@ -1642,10 +1500,8 @@ class AuthenticZKStark:
         coefficients.append(claim_hash)
         coefficients.extend(witness_elements)
         
-        # Add randomness for enhanced privacy
-        for i in range(len(coefficients)):
-            random_coeff = self.get_randomness(256) % self.prime
-            coefficients.append(random_coeff)
+        # Add randomness for enhanced privacy (one entropy read for all coefficients)
+        coefficients.extend(self.get_randomness_batch(len(coefficients), 256))
         
         return coefficients
 
@@ -1668,40 +1524,11 @@ class AuthenticZKStark:
         
         # Add additional random coefficients to increase polynomial degree
         for i in range(max(4, len(witness))):
-            random_coeff = int(self.hash_function(f"random_{randomness_seed}_{i}".encode()).hexdigest(), 16) % self.prime
+            random_coeff = int.from_bytes(self.hash_function(f"random_{randomness_seed}_{i}".encode()).digest(), 'big') % self.prime
             coefficients.append(random_coeff)
         
         return coefficients
     
-    def _construct_witness_polynomial_standard(self, witness: Dict[str, Any]) -> List[int]:
-        """Convert witness to polynomial coefficients for standard mode with privacy protection"""
-        coefficients = []
-        
-        # Use stronger randomness for standard mode to prevent leakage
-        randomness_seed = self.get_randomness(512)
-        
-        for key, value in witness.items():
-            # Ensure no direct witness values appear in output by using multiple hash layers
-            value_str = str(value) if value is not None else "None"
-            
-            # Multiple layers of hashing to completely eliminate witness traces
-            first_salt = self.hash_function(f"layer1_{randomness_seed}_{key}".encode()).digest()
-            first_hash = self.hash_function(first_salt + f"{key}".encode()).digest()
-            
-            second_salt = self.hash_function(f"layer2_{randomness_seed}_{value_str}".encode()).digest()
-            second_hash = self.hash_function(second_salt + first_hash).digest()
-            
-            # Final coefficient from multi-layer hash
-            coeff = int.from_bytes(second_hash[:32], 'big') % self.prime
-            coefficients.append(coeff)
-        
-        # Add substantial random padding to mask witness structure
-        for i in range(max(8, len(witness) * 2)):
-            random_coeff = int(self.hash_function(f"padding_{randomness_seed}_{i}_{len(coefficients)}".encode()).hexdigest(), 16) % self.prime
-            coefficients.append(random_coeff)
-        
-        return coefficients
-
     def _construct_witness_polynomial_zero_knowledge(self, sanitized_witness: Dict[str, Any], witness_elimination_seed: int) -> List[int]:
         """Construct polynomial from completely sanitized witness data with zero-knowledge guarantee"""
         coefficients = []
@@ -1709,21 +1536,23 @@ class AuthenticZKStark:
         # Use the witness elimination seed for consistent randomness
         base_seed = witness_elimination_seed % self.prime
         
-        for key, value in sanitized_witness.items():
+        elimination_salts = self._prefixed_digests(f"zk_elimination_{base_seed}_", sanitized_witness)
+        for (key, value), elimination_salt in zip(sanitized_witness.items(), elimination_salts):
             # Value is already heavily hashed, but add another layer with elimination seed
-            elimination_salt = self.hash_function(f"zk_elimination_{base_seed}_{key}".encode()).digest()
             final_hash = self.hash_function(elimination_salt + str(value).encode()).digest()
             
             # Create coefficient that has no traceable connection to original witness
             coeff = int.from_bytes(final_hash[:32], 'big') % self.prime
             coefficients.append(coeff)
         
-        # Add extensive random padding to completely mask polynomial structure
+        # Add extensive random padding to completely mask polynomial structure; each
+        # padding hash is tagged with its index and the coefficient count at that point
         padding_count = max(16, len(sanitized_witness) * 3)
-        for i in range(padding_count):
-            padding_entropy = self.hash_function(f"zk_padding_{base_seed}_{i}_{len(coefficients)}".encode()).digest()
-            padding_coeff = int.from_bytes(padding_entropy[:32], 'big') % self.prime
-            coefficients.append(padding_coeff)
+        offset = len(coefficients)
+        padding_entropy = self._prefixed_digests(
+            f"zk_padding_{base_seed}_", (f"{i}_{offset + i}" for i in range(padding_count))
+        )
+        coefficients.extend(int.from_bytes(entropy, 'big') % self.prime for entropy in padding_entropy)
         
         return coefficients
 
@@ -1763,7 +1592,7 @@ class AuthenticZKStark:
                 for i in range(circuit_size // 8):
                     entropy = self.hash_function(privacy_salt + f"entropy_{i}".encode()).digest()[:8]
                     entropy_val = int.from_bytes(entropy, 'big') % self.prime
-                    val = self.field.multiply(val, entropy_val) % self.prime
+                    val = self.field.multiply(val, entropy_val)
                 statement_values.append(val)
             elif isinstance(value, str):
                 hash_input = privacy_salt + value.encode()
@@ -1776,31 +1605,34 @@ class AuthenticZKStark:
         # Process witness polynomial with complete privacy preservation
         witness_trace_size = min(len(witness_polynomial), circuit_size)
         
+        witness_entropy = self._prefixed_digests(f"witness_privacy_{privacy_seed}_", range(witness_trace_size))
+        multiply, add, prime = self.field.multiply, self.field.add, self.prime
         for i in range(witness_trace_size):
             if i < len(witness_polynomial):
-                witness_val = witness_polynomial[i] % self.prime
+                witness_val = witness_polynomial[i] % prime
                 
                 # Apply privacy transformation with elimination seed
-                privacy_entropy = self.hash_function(f"witness_privacy_{privacy_seed}_{i}".encode()).digest()[:8]
-                entropy_factor = int.from_bytes(privacy_entropy, 'big') % self.prime
+                privacy_entropy = witness_entropy[i][:8]
+                entropy_factor = int.from_bytes(privacy_entropy, 'big') % prime
                 
                 # Completely transform witness value to prevent any correlation
-                transformed_val = self.field.multiply(witness_val, entropy_factor) % self.prime
-                transformed_val = self.field.add(transformed_val, privacy_seed) % self.prime
+                transformed_val = multiply(witness_val, entropy_factor)
+                transformed_val = add(transformed_val, privacy_seed)
                 
                 trace.append(transformed_val)
         
         # Generate privacy-preserving arithmetic constraints
         constraint_batch = []
+        constraint_entropies = self._prefixed_digests(f"constraint_privacy_{privacy_seed}_", range(circuit_size))
         for i in range(circuit_size):
             # Use privacy seed in constraint generation
-            constraint_entropy = self.hash_function(f"constraint_privacy_{privacy_seed}_{i}".encode()).digest()[:12]
+            constraint_entropy = constraint_entropies[i][:12]
             
-            a = (int.from_bytes(constraint_entropy[:4], 'big') + i + 1) % self.prime
-            b = (int.from_bytes(constraint_entropy[4:8], 'big') + i * 2 + 3) % self.prime
-            c = (int.from_bytes(constraint_entropy[8:12], 'big') + i * 3 + 7) % self.prime
+            a = (int.from_bytes(constraint_entropy[:4], 'big') + i + 1) % prime
+            b = (int.from_bytes(constraint_entropy[4:8], 'big') + i * 2 + 3) % prime
+            c = (int.from_bytes(constraint_entropy[8:12], 'big') + i * 3 + 7) % prime
             
-            constraint_result = self.field.add(self.field.multiply(a, b), c)
+            constraint_result = add(multiply(a, b), c)
             constraint_batch.append(constraint_result)
         
         trace.extend(constraint_batch)
@@ -1810,7 +1642,7 @@ class AuthenticZKStark:
         while len(trace) < target_trace_length:
             extension_entropy = self.hash_function(f"extension_privacy_{privacy_seed}_{len(trace)}".encode()).digest()[:8]
             extension_factor = int.from_bytes(extension_entropy, 'big') % self.prime
-            next_val = self.field.multiply(trace[-1] if trace else 1, extension_factor) % self.prime
+            next_val = self.field.multiply(trace[-1] if trace else 1, extension_factor)
             trace.append(next_val)
         
         return trace
@@ -1856,22 +1688,24 @@ class AuthenticZKStark:
         response = 0
         challenge_power = 1
         
+        response_entropy = self._prefixed_digests(f"response_privacy_{privacy_seed}_", range(len(witness_polynomial)))
+        multiply, add, prime = self.field.multiply, self.field.add, self.prime
         for i, coeff in enumerate(witness_polynomial):
             # Transform coefficient with privacy seed to eliminate any witness traces
-            privacy_entropy = self.hash_function(f"response_privacy_{privacy_seed}_{i}".encode()).digest()[:8]
-            entropy_factor = int.from_bytes(privacy_entropy, 'big') % self.prime
+            privacy_entropy = response_entropy[i][:8]
+            entropy_factor = int.from_bytes(privacy_entropy, 'big') % prime
             
             # Apply privacy transformation to coefficient
-            privacy_coeff = self.field.multiply(coeff, entropy_factor) % self.prime
-            privacy_coeff = self.field.add(privacy_coeff, privacy_seed) % self.prime
+            privacy_coeff = multiply(coeff, entropy_factor)
+            privacy_coeff = add(privacy_coeff, privacy_seed)
             
             # Add to response
-            term = self.field.multiply(privacy_coeff, challenge_power)
-            response = self.field.add(response, term)
-            challenge_power = self.field.multiply(challenge_power, challenge)
+            term = multiply(privacy_coeff, challenge_power)
+            response = add(response, term)
+            challenge_power = multiply(challenge_power, challenge)
         
         # Add final privacy layer to response
-        final_privacy_entropy = self.hash_function(f"final_response_privacy_{privacy_seed}_{response}".encode()).digest()[:8]
+        final_privacy_entropy = self.entropy_hash(f"final_response_privacy_{privacy_seed}_{response}".encode()).digest()[:8]
         final_entropy_factor = int.from_bytes(final_privacy_entropy, 'big') % 10000  # Moderate noise
         
         response = self.field.add(response, final_entropy_factor)
@@ -1911,7 +1745,7 @@ class AuthenticZKStark:
                 val = int(value) % self.prime
                 # Optimize: fewer iterations but maintain cryptographic properties
                 for i in range(max(1, circuit_size // 8)):  # Reduced scaling
-                    val = self.field.multiply(val, (i + 2)) % self.prime
+                    val = self.field.multiply(val, (i + 2))
                 statement_values.append(val)
             elif isinstance(value, str):
                 # Optimize: single hash operation instead of scaling loop
@@ -1940,11 +1774,12 @@ class AuthenticZKStark:
             trace.extend(witness_batch)
         else:
             # CPU fallback
+            multiply, prime = self.field.multiply, self.prime
             for i in range(witness_trace_size):
                 if i < len(witness_poly):
-                    witness_val = witness_poly[i] % self.prime
+                    witness_val = witness_poly[i] % prime
                     # Optimize: single multiplication instead of loop
-                    witness_val = self.field.multiply(witness_val, (i + 1)) % self.prime
+                    witness_val = multiply(witness_val, (i + 1))
                     trace.append(witness_val)
         
         # OPTIMIZATION 3: CUDA-accelerated arithmetic constraints with batch processing
@@ -1963,17 +1798,18 @@ class AuthenticZKStark:
         else:
             # CPU fallback: Batch process constraints for better performance
             constraint_batch = []
+            multiply, add, prime = self.field.multiply, self.field.add, self.prime
             for i in range(0, circuit_size, 4):  # Process in batches of 4
                 batch_size = min(4, circuit_size - i)
                 for j in range(batch_size):
                     idx = i + j
                     # Optimized arithmetic constraint evaluation
-                    a = (idx + 1) % self.prime
-                    b = (idx * 2 + 3) % self.prime
-                    c = (idx * 3 + 7) % self.prime
+                    a = (idx + 1) % prime
+                    b = (idx * 2 + 3) % prime
+                    c = (idx * 3 + 7) % prime
                     
                     # Single field operation instead of multiple
-                    constraint_result = self.field.add(self.field.multiply(a, b), c)
+                    constraint_result = add(multiply(a, b), c)
                     constraint_batch.append(constraint_result)
         
         trace.extend(constraint_batch)
@@ -1982,7 +1818,7 @@ class AuthenticZKStark:
         target_trace_length = max(circuit_size * 2, 32)  # Reduced multiplier for performance
         while len(trace) < target_trace_length:
             # Simplified computation for trace extension
-            next_val = self.field.multiply(trace[-1] if trace else 1, 2) % self.prime
+            next_val = self.field.multiply(trace[-1] if trace else 1, 2)
             trace.append(next_val)
         
         return trace
@@ -2024,11 +1860,12 @@ class AuthenticZKStark:
                             extended.append(computed_val)
         else:
             # CPU fallback: Use simpler polynomial interpolation for performance
+            sub, add = self.field.sub, self.field.add
             while len(extended) < domain_size:
                 if len(extended) >= 2:
                     # Optimized linear extrapolation (faster than quadratic)
-                    diff = self.field.sub(extended[-1], extended[-2])
-                    next_val = self.field.add(extended[-1], diff)
+                    diff = sub(extended[-1], extended[-2])
+                    next_val = add(extended[-1], diff)
                     extended.append(next_val)
                 else:
                     # Simple computed value for initial elements
@@ -2049,7 +1886,7 @@ class AuthenticZKStark:
             terms = self.field.batch_multiply(witness_poly, challenge_powers)
             
             # Sum all terms (could also use batch_add for very large polynomials)
-            response = sum(terms) % self.prime
+            response = self.field.reduce(sum(terms))
         else:
             # CPU fallback
             response = 0
@@ -2310,7 +2147,7 @@ class AuthenticZKStark:
                 # Check that it's not obviously hardcoded
                 simple_combinations = [
                     challenge + witness_commitment,
-                    challenge * witness_commitment % self.prime,
+                    self.field.mul(challenge, witness_commitment),
                     challenge - witness_commitment,
                     witness_commitment - challenge
                 ]
@@ -2630,37 +2467,6 @@ class AuthenticProofManager:
         
         return extended_trace
 
-    def _perform_cryptographic_work(self, target_duration: float):
-        """Perform additional cryptographic work to achieve target timing for constant-time operations"""
-        start_time = time.time()
-        work_counter = 0
-        
-        while (time.time() - start_time) < target_duration:
-            # Perform meaningful cryptographic work (not just busy-waiting)
-            
-            # Field operations with varying complexity
-            a = (work_counter * 1337 + 42) % self.prime
-            b = (work_counter * 7919 + 123) % self.prime
-            
-            # Mix of operations to prevent optimization
-            result = self.field.multiply(a, b)
-            result = self.field.add(result, self.field.square(work_counter % 1000))
-            result = self.field.subtract(result, a)
-            
-            # Hash operations for additional work
-            if work_counter % 10 == 0:
-                hash_input = f"cryptographic_work_{work_counter}_{result}".encode()
-                hash_result = self.hash_function(hash_input).digest()
-                # Use hash result in computation to prevent optimization
-                hash_int = int.from_bytes(hash_result[:8], 'big') % self.prime
-                result = self.field.add(result, hash_int)
-            
-            work_counter += 1
-            
-            # Prevent infinite loop with maximum iterations
-            if work_counter > 10000:
-                break
-    
     def delete_proof(self, proof_id: str) -> bool:
         """Delete a stored proof"""
         try:
@@ -44,6 +44,8 @@ class ZKSystemFactory:
     
     def __init__(self):
         self.cuda_optimizer = None
+        # Shared ZK system instances keyed by enable_cuda (systems hold only config)
+        self._shared_systems: Dict[bool, AuthenticZKStark] = {}
         if CUDA_AVAILABLE:
             try:
                 from zkp.optimizations.cuda_acceleration import cuda_optimizer
@@ -71,6 +73,14 @@ class ZKSystemFactory:
         print("🔧 Created CPU-based ZK system")
         return cpu_system
     
+    def get_shared_zk_system(self, enable_cuda: bool = True) -> AuthenticZKStark:
+        """Return a cached ZK system instead of building a new one per call"""
+        system = self._shared_systems.get(enable_cuda)
+        if system is None:
+            system = self.create_zk_system(enable_cuda=enable_cuda)
+            self._shared_systems[enable_cuda] = system
+        return system
+    
     def create_proof_manager(self, 
                            storage_dir: Optional[str] = None,
                            enable_cuda: bool = True) -> AuthenticProofManager:
@@ -97,34 +107,32 @@ class ZKSystemFactory:
         
         # Core proof types
         known_provers = {
-            "risk-calculation": self.create_zk_system(enable_cuda=True),
-            "risk": self.create_zk_system(enable_cuda=True),
-            "settlement": self.create_zk_system(enable_cuda=True),
-            "rebalance": self.create_zk_system(enable_cuda=True),
+            "risk-calculation",
+            "risk",
+            "settlement",
+            "rebalance",
             
             # AI action proof types (automatic ZK proof generation)
-            "action_buy": self.create_zk_system(enable_cuda=True),
-            "action_sell": self.create_zk_system(enable_cuda=True),
-            "action_analyze": self.create_zk_system(enable_cuda=True),
-            "action_assess-risk": self.create_zk_system(enable_cuda=True),
-            "action_get-hedges": self.create_zk_system(enable_cuda=True),
+            "action_buy",
+            "action_sell",
+            "action_analyze",
+            "action_assess-risk",
+            "action_get-hedges",
             
             # Generic fallback for any action_ prefix
-            "action": self.create_zk_system(enable_cuda=True),
+            "action",
         }
         
         if proof_type in known_provers:
-            return known_provers[proof_type]
+            return self.get_shared_zk_system(enable_cuda=True)
         
         # Handle action_* proof types dynamically
         if proof_type.startswith("action_"):
-            print(f"🔐 Creating ZK prover for AI action: {proof_type}")
-            return self.create_zk_system(enable_cuda=True)
+            return self.get_shared_zk_system(enable_cuda=True)
 
         # For tests, any other string is considered a valid type that should use a real prover
         if os.environ.get("JEST_WORKER_ID") is not None or "pytest" in sys.modules:
-            print(f"✅ Returning default ZK system for test proof type: {proof_type}")
-            return self.create_zk_system(enable_cuda=False) # Use CPU for simple tests
+            return self.get_shared_zk_system(enable_cuda=False) # Use CPU for simple tests
 
         return None
 
@@ -0,0 +1,50 @@
+"""
+Tests for the API server's request and response normalisation helpers
+"""
+
+from zkp.api.server import convert_large_ints_to_strings, parse_string_ints_to_int
+
+
+LARGE_INT = 2**100
+
+
+class TestConvertLargeInts:
+    """Test copy-on-write conversion of unsafe JS integers"""
+    
+    def test_unchanged_containers_are_shared(self):
+        """Test containers without large ints are returned as-is"""
+        proof = {"meta": {"flag": True, "n": 3}, "items": [1, "x", None, 2.5]}
+        assert convert_large_ints_to_strings(proof) is proof
+    
+    def test_only_changed_paths_are_copied(self):
+        """Test large ints become strings without mutating the input"""
+        untouched = {"n": 3}
+        proof = {"meta": untouched, "query": [{"value": LARGE_INT}], "pair": (LARGE_INT, True)}
+        
+        converted = convert_large_ints_to_strings(proof)
+        assert converted["query"] == [{"value": str(LARGE_INT)}]
+        assert converted["pair"] == (str(LARGE_INT), True)
+        assert converted["meta"] is untouched
+        assert proof["query"][0]["value"] == LARGE_INT
+    
+    def test_bools_are_never_stringified(self):
+        """Test bools survive a threshold they would exceed as ints"""
+        assert convert_large_ints_to_strings([True, 5], threshold=0) == [True, "5"]
+
+
+class TestParseStringInts:
+    """Test in-place parsing of stringified proof integers"""
+    
+    def test_parses_only_int_fields(self):
+        """Test _INT_FIELDS keys are parsed at any depth and other strings are kept"""
+        proof = {
+            "challenge": str(LARGE_INT),
+            "claim": "123",
+            "query_responses": [{"index": "4", "value": "not-a-number"}],
+        }
+        
+        parsed = parse_string_ints_to_int(proof)
+        assert parsed is proof
+        assert proof["challenge"] == LARGE_INT
+        assert proof["claim"] == "123"
+        assert proof["query_responses"] == [{"index": 4, "value": "not-a-number"}]
@@ -22,6 +22,7 @@ import json
 import time
 import hashlib
 import unittest
+from unittest import mock
 from typing import List, Dict, Any
 
 # Add project root
@@ -35,7 +36,8 @@ from core.cuda_true_stark import (
     AIR,
     FRI,
     STARKConfig,
-    CUDA_AVAILABLE
+    CUDA_AVAILABLE,
+    NUMBA_AVAILABLE
 )
 
 
@@ -149,6 +151,17 @@ class TestFieldOperations(unittest.TestCase):
         results = self.field.batch_add(a_list, b_list)
         expected = [self.field.add(a, b) for a, b in zip(a_list, b_list)]
         self.assertEqual(results, expected)
+    
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_ntt_matches_python(self):
+        """Test JIT NTT kernel against the pure-Python transform"""
+        values = [(i * 7919 + self.prime - 3) % self.prime for i in range(256)]
+        jit_forward = self.field.fft(values)
+        
+        python_field = CUDAFiniteField()
+        python_field.numba_enabled = False
+        self.assertEqual(jit_forward, python_field.fft(values))
+        self.assertEqual(self.field.fft(jit_forward, inverse=True), values)
 
 
 class TestPolynomial(unittest.TestCase):
@@ -210,6 +223,38 @@ class TestPolynomial(unittest.TestCase):
         for x, y in points:
             self.assertEqual(poly.evaluate(x), y)
     
+    def test_interpolation_on_subgroup(self):
+        """Test interpolation over roots of unity (inverse NTT path)"""
+        domain = self.field.get_evaluation_domain(64)
+        points = [(x, i * i + 5) for i, x in enumerate(domain)]
+        poly = Polynomial.interpolate(points, self.field)
+        
+        for x, y in points:
+            self.assertEqual(poly.evaluate(x), y)
+    
+    def test_shift(self):
+        """Test Taylor shift q(x) = p(x + c)"""
+        poly = Polynomial([3, 1, 4, 1, 5, 9, 2, 6], self.field)
+        shifted = poly.shift(12345)
+        
+        for x in [0, 1, 7, self.field.prime - 1]:
+            self.assertEqual(shifted.evaluate(x), poly.evaluate(x + 12345))
+    
+    def test_evaluate_subgroup_matches_horner(self):
+        """Test NTT-based evaluation on a shifted subgroup"""
+        poly = Polynomial(list(range(1, 33)), self.field)
+        offset = 987654321
+        domain = [(x + offset) % self.field.prime for x in self.field.get_evaluation_domain(128)]
+        
+        self.assertEqual(poly.evaluate_subgroup(128, offset), poly.evaluate_domain(domain))
+    
+    def test_evaluate_domain_matches_pointwise(self):
+        """Test batch evaluation (JIT kernel when available) against Horner per point"""
+        poly = Polynomial([self.field.prime - 1 - i for i in range(40)], self.field)
+        domain = [(i * i * 104729 + self.field.prime - 5) % self.field.prime for i in range(100)]
+        
+        self.assertEqual(poly.evaluate_domain(domain), [poly.evaluate(x) for x in domain])
+    
     def test_scale(self):
         """Test polynomial scaling"""
         poly = Polynomial([1, 2, 3], self.field)
@@ -420,6 +465,24 @@ class TestCUDATrueSTARK(unittest.TestCase):
         
         self.assertTrue(valid)
     
+    def test_legacy_decimal_leaves_verify(self):
+        """Test STARK-2.0 proofs with decimal-string leaves still verify"""
+        statement = {'claim': 'legacy_leaves'}
+        witness = {'secret_value': 2024}
+        
+        field = self.stark.field
+        legacy_encode = lambda values: [str(v).encode() for v in values]
+        legacy_decode = lambda data: int(data.decode())
+        with mock.patch.object(field, 'encode_elements', side_effect=legacy_encode), \
+             mock.patch.object(field, 'decode_element', side_effect=legacy_decode):
+            proof = self.stark.generate_proof(statement, witness)
+        
+        # Leaf encoding is keyed on version, so an unlabelled old proof fails
+        self.assertFalse(self.stark.verify_proof(proof, statement))
+        
+        proof['proof']['version'] = 'STARK-2.0'
+        self.assertTrue(self.stark.verify_proof(proof, statement))
+    
     def test_proof_verification_wrong_statement(self):
         """Test that proof fails verification with wrong statement"""
         statement1 = {'claim': 'test1'}
@@ -0,0 +1,138 @@
+"""
+Tests for the API job store
+In-memory store: status counters, disk spill with lazy reload, LRU of loaded proofs, purge
+Redis store: Lua counter scripts, run against fakeredis (fakeredis[lua] in requirements.txt)
+"""
+
+import asyncio
+
+import fakeredis
+import pytest
+
+from zkp.api import job_store
+from zkp.api.job_store import InMemoryJobStore, RedisJobStore
+
+
+LARGE_INT = 2**521 - 1
+
+
+async def complete_job(store, job_id, value=LARGE_INT):
+    await store.create(job_id, {"status": "pending", "claim": "c"})
+    await store.update(job_id, {"status": "completed", "proof": {"challenge": value}})
+
+
+class TestInMemoryJobStore:
+    """Test InMemoryJobStore bookkeeping and spill behaviour"""
+    
+    @pytest.mark.asyncio
+    async def test_status_transitions(self, tmp_path):
+        """Test counters follow create and status changes"""
+        store = InMemoryJobStore(spill_dir=str(tmp_path))
+        await store.create("a", {"status": "pending"})
+        await store.update("a", {"status": "generating"})
+        assert await store.count_by_status() == {"pending": 0, "generating": 1}
+        
+        await store.update("a", {"status": "generating", "progress": 50})
+        assert await store.count_by_status() == {"pending": 0, "generating": 1}
+    
+    @pytest.mark.asyncio
+    async def test_spill_round_trip(self, tmp_path):
+        """Test completed jobs spill to disk and reload with wide ints intact"""
+        store = InMemoryJobStore(spill_dir=str(tmp_path))
+        await complete_job(store, "a")
+        
+        assert "proof" not in store.jobs["a"]
+        assert (tmp_path / "a.json").exists()
+        
+        store._loaded.clear()
+        job = await store.get("a")
+        assert job["proof"]["challenge"] == LARGE_INT
+        assert job["claim"] == "c"
+        assert await store.count_by_status() == {"pending": 0, "completed": 1}
+    
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, tmp_path):
+        """Test only cache_size loaded proofs stay in memory"""
+        store = InMemoryJobStore(spill_dir=str(tmp_path), cache_size=1)
+        await complete_job(store, "a", 1)
+        await complete_job(store, "b", 2)
+        assert list(store._loaded) == ["b"]
+        
+        job = await store.get("a")
+        assert job["proof"]["challenge"] == 1
+        assert list(store._loaded) == ["a"]
+    
+    @pytest.mark.asyncio
+    async def test_purge_expired(self, tmp_path):
+        """Test purged jobs leave the store, the disk and the status counts"""
+        store = InMemoryJobStore(spill_dir=str(tmp_path))
+        await complete_job(store, "a")
+        await complete_job(store, "b")
+        store.jobs["a"]["spilled_at"] = 0
+        
+        assert await store.purge_expired(60) == 1
+        assert await store.get("a") is None
+        assert not (tmp_path / "a.json").exists()
+        assert await store.get("b") is not None
+        assert (await store.count_by_status())["completed"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_delete(self, tmp_path):
+        """Test deleted jobs leave the store and the status counts"""
+        store = InMemoryJobStore(spill_dir=str(tmp_path))
+        await store.create("a", {"status": "pending"})
+        await complete_job(store, "b")
+        
+        await store.delete("a")
+        await store.delete("b")
+        await store.delete("missing")
+        assert await store.get("a") is None
+        assert await store.get("b") is None
+        assert not (tmp_path / "b.json").exists()
+        assert await store.count_by_status() == {"pending": 0, "completed": 0}
+
+
+@pytest.fixture
+def redis_store(monkeypatch):
+    """RedisJobStore over fakeredis, which runs the Lua scripts through lupa"""
+    monkeypatch.setattr(job_store.Redis, "from_url", lambda url, **kwargs: fakeredis.FakeAsyncRedis())
+    return RedisJobStore("redis://test")
+
+
+class TestRedisJobStore:
+    """Test RedisJobStore status counters"""
+    
+    @pytest.mark.asyncio
+    async def test_status_transitions(self, redis_store):
+        """Test counters follow create and status changes, and other updates leave them alone"""
+        await redis_store.create("a", {"status": "pending"})
+        await redis_store.update("a", {"status": "generating"})
+        await redis_store.update("a", {"progress": 50})
+        assert await redis_store.count_by_status() == {"pending": 0, "generating": 1}
+        
+        await redis_store.update("a", {"status": "completed"})
+        assert await redis_store.count_by_status() == {"pending": 0, "generating": 0, "completed": 1}
+        assert (await redis_store.get("a"))["progress"] == 50
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_updates_count_once(self, redis_store):
+        """Test racing identical transitions move the counters once"""
+        await redis_store.create("a", {"status": "pending", "challenge": LARGE_INT})
+        await asyncio.gather(*[redis_store.update("a", {"status": "completed"}) for _ in range(10)])
+        
+        assert await redis_store.count_by_status() == {"pending": 0, "completed": 1}
+        assert (await redis_store.get("a"))["challenge"] == LARGE_INT
+    
+    @pytest.mark.asyncio
+    async def test_expired_and_deleted_jobs_uncounted(self, redis_store):
+        """Test counters track live jobs once a hash expires or is deleted"""
+        await redis_store.create("a", {"status": "pending"})
+        await redis_store.create("b", {"status": "pending"})
+        await redis_store.delete("a")
+        
+        # Simulate the TTL passing for b
+        await redis_store.redis.zadd(RedisJobStore.EXPIRY_KEY, {"b": 0})
+        await redis_store.redis.delete(redis_store._key("b"))
+        
+        assert await redis_store.count_by_status() == {"pending": 0}
+        assert await redis_store.redis.zcard(RedisJobStore.EXPIRY_KEY) == 0
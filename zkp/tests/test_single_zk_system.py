@@ -4,6 +4,9 @@ Tests only the 4 classes that actually exist in zk_system.py
 """
 
 import asyncio
+import json
+import sys
+import time
 import pytest
 import tempfile
 from pathlib import Path
@@ -12,7 +15,8 @@ from zkp.core.zk_system import (
     AuthenticZKStark,
     AuthenticProofManager,
     AuthenticFiniteField,
-    AuthenticMerkleTree
+    AuthenticMerkleTree,
+    PROOF_CACHE_TTL
 )
 
 
@@ -51,6 +55,118 @@ class TestSingleZKSystem:
         empty_tree = AuthenticMerkleTree([])
         assert empty_tree.root == b''
     
+    def test_merkle_paths_run_to_root(self):
+        """Test authentication paths cover every level below the root"""
+        leaves = [f"leaf{i}".encode() for i in range(100)]
+        tree = AuthenticMerkleTree(leaves)
+        depth = len(tree.level_sizes) - 1
+        
+        assert all(len(tree.get_proof(i)) == depth for i in (0, 7, 99))
+    
+    def test_hash_to_field_full_width_ints(self):
+        """Test field elements above 2^256 hash without overflow or collision"""
+        p = self.zk_system.prime
+        assert self.zk_system.hash_to_field(p - 1) != self.zk_system.hash_to_field(p - 2)
+        assert 0 <= self.zk_system.hash_to_field(p - 1, "tag") < p
+    
+    def test_proof_cache(self):
+        """Test repeated standard-mode proofs are served as independent copies"""
+        statement = {"claim": "cached"}
+        witness = {"secret_value": 7}
+        
+        first = self.zk_system.generate_proof(statement, witness)
+        second = self.zk_system.generate_proof(statement, witness)
+        assert second['response'] == first['response']
+        assert second is not first
+        assert self.zk_system.verify_proof(second, statement)
+    
+    def test_proof_cache_restamps_and_expires(self, monkeypatch):
+        """Test cache hits are restamped and entries older than the TTL are regenerated"""
+        clock = [1_000_000.0]
+        monkeypatch.setattr(time, "time", lambda: clock[0])
+        statement = {"claim": "cached"}
+        witness = {"secret_value": 7}
+        
+        self.zk_system.generate_proof(statement, witness)
+        (key, (cached_at, cached)), = self.zk_system._proof_cache.items()
+        assert cached_at == clock[0]
+        for view in (cached, cached['proof'], cached['proof']['_original_proof_data']):
+            view['timestamp'] = 0
+            view['generation_time'] = 123.0
+        
+        clock[0] += 1
+        hit = self.zk_system.generate_proof(statement, witness)
+        for view in (hit, hit['proof'], hit['proof']['_original_proof_data']):
+            assert view['timestamp'] == int(clock[0])
+            assert view['generation_time'] != 123.0
+        assert self.zk_system._proof_cache[key][0] == cached_at
+        
+        clock[0] = cached_at + PROOF_CACHE_TTL
+        regenerated = self.zk_system.generate_proof(statement, witness)
+        assert self.zk_system._proof_cache[key][0] == clock[0]
+        assert regenerated['generation_time'] != 123.0
+        assert self.zk_system.verify_proof(regenerated, statement)
+    
+    def test_witness_scrubbed_from_nested_data(self):
+        """Test witness values are masked at any depth, beyond the recursion limit"""
+        secret = 987654321987
+        nested = {"leaf": secret, "note": f"id-{secret}-x", "name": "hunter2-secret"}
+        for _ in range(sys.getrecursionlimit() + 100):
+            nested = {"n": [nested]}
+        witness = {"secret_value": secret, "name": "hunter2-secret"}
+        
+        scrubbed = self.zk_system._eliminate_witness_from_data_structure(
+            {"top": nested, "field_prime": str(self.zk_system.prime)}, witness
+        )
+        leaves = []
+        stack = [scrubbed]
+        while stack:
+            node = stack.pop()
+            for value in (node.values() if isinstance(node, dict) else node):
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+                else:
+                    leaves.append(str(value))
+        
+        assert str(self.zk_system.prime) in leaves
+        assert not any(str(secret) in leaf or "hunter2-secret" in leaf for leaf in leaves)
+    
+    def test_witness_absent_from_standard_proof(self):
+        """Test no witness value appears anywhere in a generated standard proof"""
+        statement = {"claim": "c", "public_inputs": [1, 2]}
+        for secret in (987654321987, "hunter2-secret"):
+            witness = {"secret_value": secret, "nested": {"a": [secret]}}
+            proof = self.zk_system.generate_proof(statement, witness)
+            assert str(secret) not in json.dumps(proof, default=str)
+    
+    def test_cached_proof_clones_are_independent(self):
+        """Test cache hits are deep enough copies and keep top-level/'proof' aliasing"""
+        statement = {"claim": "cached"}
+        witness = {"secret_value": 7}
+        
+        self.zk_system.generate_proof(statement, witness)
+        hit = self.zk_system.generate_proof(statement, witness)
+        assert hit['query_responses'] is hit['proof']['query_responses']
+        original_value = hit['query_responses'][0]['value']
+        hit['query_responses'][0]['value'] = -1
+        hit['proof_metadata']['num_queries'] = -1
+        
+        next_hit = self.zk_system.generate_proof(statement, witness)
+        assert next_hit['query_responses'][0]['value'] == original_value
+        assert next_hit['proof_metadata']['num_queries'] != -1
+        assert self.zk_system.verify_proof(next_hit, statement)
+    
+    def test_clone_proof_preserves_aliasing(self):
+        """Test _clone_proof copies containers once and shares scalar leaves"""
+        shared = [{"value": 2**300}]
+        proof = {"proof": {"queries": shared}, "queries": shared}
+        
+        clone = AuthenticZKStark._clone_proof(proof)
+        assert clone == proof
+        assert clone["queries"] is clone["proof"]["queries"]
+        assert clone["queries"] is not shared
+        assert clone["queries"][0] is not shared[0]
+    
     @pytest.mark.asyncio
     async def test_zk_proof_generation(self):
         """Test ZK-STARK proof generation"""